@@ -1,10 +1,103 @@
-from django.contrib import admin
-from .models import Faculty, CourseModality
+from django.contrib import admin, messages
+from django.db import transaction
+from django.db.models import Q
+from django.utils import timezone
+
+from .db import retry_on_lock
+from .export import selection_response
+from .incremental import delete_records, forget
+from .models import Faculty, CourseModality, CourseModalityArchive, UploadJob
+from .normalize import search_key
+from .pagecache import VersionedCountPaginator
+from .versioning import bump_data_version
+
+
+class ScalableAdminMixin:
+    """
+    큰 테이블용 changelist 설정.
+    - 검색: 정규화된 검색 키(korean_key / english_key)의 접두어 범위(>=, <) 조건 -> 인덱스 범위 검색
+      (기본 admin 검색의 icontains 는 매번 전체 테이블을 훑는다)
+    - 전체 건수: VersionedCountPaginator 로 데이터 버전별 캐시, 필터 없는 전체 COUNT(*) 는 생략
+    - 일괄 삭제: 청크별 DELETE + 증분 업로드 hash 삭제 / 데이터 버전 갱신 한 번 (delete_records)
+    """
+    search_fields = ('korean_key', 'english_key')
+    paginator = VersionedCountPaginator
+    show_full_result_count = False
+
+    def get_search_results(self, request, queryset, search_term):
+        key = search_key(search_term)
+        if not key:
+            return queryset, False
+        end = key + '\U0010ffff'
+        prefix = Q(korean_key__gte=key, korean_key__lt=end) | Q(english_key__gte=key, english_key__lt=end)
+        return queryset.filter(prefix), False
+
+    def delete_queryset(self, request, queryset):
+        retry_on_lock(lambda: delete_records(queryset))
+
 
 @admin.register(Faculty)
-class FacultyAdmin(admin.ModelAdmin):
+class FacultyAdmin(ScalableAdminMixin, admin.ModelAdmin):
     list_display = ('korean_name', 'english_name', 'category', 'email')
 
+
+def _set_apply(queryset, value):
+    """
+    선택한 레코드의 Apply 값을 UPDATE 한 번으로 변경하고 바뀐 건수를 반환.
+    update() 는 signal 이 없으므로 데이터 버전 갱신과 증분 업로드 hash 삭제를 여기서 직접 한다.
+    """
+    queryset = queryset.exclude(apply_this_semester=value)
+    names = list(queryset.order_by().values_list('korean_name', flat=True).distinct())
+
+    def write():
+        with transaction.atomic():
+            updated = queryset.update(apply_this_semester=value, modified_date=timezone.now())
+            forget('course', names)
+        return updated
+
+    updated = retry_on_lock(write)
+    if updated:
+        bump_data_version(CourseModality)
+    return updated
+
+
+@admin.action(description='Export selected (CSV)', permissions=['view'])
+def export_selection(modeladmin, request, queryset):
+    return selection_response(queryset)
+
+
 @admin.register(CourseModality)
-class CourseModalityAdmin(admin.ModelAdmin):
+class CourseModalityAdmin(ScalableAdminMixin, admin.ModelAdmin):
     list_display = ('id', 'korean_name', 'english_name', 'year', 'semester', 'apply_this_semester', 'modified_date')
+    list_filter = ('term_year', 'term_semester', 'apply_this_semester')
+    actions = ('mark_apply', 'cancel_apply', export_selection)
+
+    @admin.action(description='Mark selected as Apply', permissions=['change'])
+    def mark_apply(self, request, queryset):
+        updated = _set_apply(queryset, True)
+        self.message_user(request, f'{updated} record(s) marked as Apply.', messages.SUCCESS)
+
+    @admin.action(description='Cancel Apply for selected', permissions=['change'])
+    def cancel_apply(self, request, queryset):
+        updated = _set_apply(queryset, False)
+        self.message_user(request, f'{updated} record(s) cancelled.', messages.SUCCESS)
+
+
+@admin.register(CourseModalityArchive)
+class CourseModalityArchiveAdmin(ScalableAdminMixin, admin.ModelAdmin):
+    """보관된 지난 학기 레코드 (조회 / export 전용, manage.py archive_courses 로만 추가)."""
+    list_display = ('original_id', 'korean_name', 'english_name', 'year', 'semester', 'apply_this_semester', 'archived_at')
+    list_filter = ('term_year', 'term_semester', 'apply_this_semester')
+    actions = (export_selection,)
+
+    def has_add_permission(self, request):
+        return False
+
+    def has_change_permission(self, request, obj=None):
+        return False
+
+
+@admin.register(UploadJob)
+class UploadJobAdmin(admin.ModelAdmin):
+    list_display = ('id', 'kind', 'original_name', 'status', 'rows_processed', 'total_rows', 'created_at', 'finished_at')
+    list_filter = ('kind', 'status')
@@ -0,0 +1,92 @@
+"""
+JSON 검색 / 자동완성(typeahead) API.
+- GET /api/faculty/search?q=...&page=1&page_size=20
+- GET /api/course/search?q=...&page=1&page_size=20
+- GET /api/course/lookup?name=...&name=... (여러 이름 일괄 조회, core/lookup.py)
+search 는 q 로 시작하는 한글/영문 이름을 메모리 접두어 인덱스에서 찾는다.
+course API 는 scope=current(기본, 현재 학기) | all | archive 로 학기 범위를 고른다 (core/terms.py).
+course 결과에는 'archived' 표시, archive 이면 원래 레코드 번호 'original_id' 도 포함 ('id' 는 보관 테이블의 id).
+ETag 는 데이터 버전이므로, 업로드/신청으로 데이터가 바뀌기 전까지는 304 로 응답할 수 있다.
+"""
+from django.http import JsonResponse
+from django.views.decorators.cache import cache_control
+from django.views.decorators.http import condition, require_GET
+
+from .models import CourseModality, CourseModalityArchive, Faculty
+from .terms import SCOPES, archive_row, record_fields, scoped_courses
+from .versioning import get_data_version
+
+DEFAULT_PAGE_SIZE = 20
+MAX_PAGE_SIZE = 100
+
+# 응답에 포함할 필드 (password, reason 등은 제외)
+API_FIELDS = {
+    Faculty: ('id', 'korean_name', 'english_name', 'category', 'email'),
+    CourseModality: ('id', 'korean_name', 'english_name', 'year', 'semester', 'course_title'),
+}
+
+
+def _int_param(request, name, default, minimum=1, maximum=None):
+    try:
+        value = int(request.GET.get(name, default))
+    except (TypeError, ValueError):
+        value = default
+    value = max(value, minimum)
+    return min(value, maximum) if maximum else value
+
+
+def _scope(request):
+    scope = request.GET.get('scope', 'current')
+    return scope if scope in SCOPES else 'current'
+
+
+def _search(request, model):
+    from .search_index import get_prefix_index  # numpy / rapidfuzz 는 검색할 때만 로드
+    q = request.GET.get('q', '').strip()
+    page = _int_param(request, 'page', 1)
+    page_size = _int_param(request, 'page_size', DEFAULT_PAGE_SIZE, maximum=MAX_PAGE_SIZE)
+    scope = _scope(request)
+    ids = get_prefix_index(model, scope).search(q)
+    page_ids = ids[(page - 1) * page_size:page * page_size]
+    if model is CourseModality:
+        records = scoped_courses(scope).filter(id__in=page_ids).values(*record_fields(API_FIELDS[model], scope))
+        rows = {r['id']: archive_row(r, scope) for r in records}
+    else:
+        rows = {r['id']: r for r in model.objects.filter(id__in=page_ids).values(*API_FIELDS[model])}
+    return JsonResponse({
+        'query': q,
+        'page': page,
+        'page_size': page_size,
+        'total': len(ids),
+        'results': [rows[pk] for pk in page_ids if pk in rows],
+    }, json_dumps_params={'ensure_ascii': False, 'separators': (',', ':')})
+
+
+def _etag_for(*models):
+    return lambda request: get_data_version(*models)
+
+
+@require_GET
+@cache_control(public=True, no_cache=True)
+@condition(etag_func=_etag_for(Faculty))
+def faculty_search_api(request):
+    return _search(request, Faculty)
+
+
+@require_GET
+@cache_control(public=True, no_cache=True)
+@condition(etag_func=_etag_for(CourseModality, CourseModalityArchive))
+def course_search_api(request):
+    return _search(request, CourseModality)
+
+
+@require_GET
+@cache_control(public=True, no_cache=True)
+@condition(etag_func=_etag_for(CourseModality, CourseModalityArchive))
+def course_lookup_api(request):
+    from .lookup import MAX_NAMES, lookup_courses
+    names = [n for n in request.GET.getlist('name') if n.strip()]
+    if len(names) > MAX_NAMES:
+        return JsonResponse({'error': f'too many names (max {MAX_NAMES})'}, status=400)
+    return JsonResponse({'results': lookup_courses(names, scope=_scope(request))},
+                        json_dumps_params={'ensure_ascii': False, 'separators': (',', ':')})
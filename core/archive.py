@@ -0,0 +1,64 @@
+"""
+지난 학기 CourseModality 보관(archive).
+- before 학기(기본: 현재 학기)보다 이전 학기 레코드를 CourseModalityArchive 로 복사하고 원래 테이블에서 삭제
+  -> 검색 / export / 이름 인덱스가 읽는 CourseModality 는 현재 학기 규모로 유지
+- BATCH_SIZE 건씩 (복사 + 삭제) 트랜잭션, 끝나면 데이터 버전 갱신
+- 옮긴 이름의 증분 업로드 hash 삭제: 다음 업로드 때 같은 이름이 있으면 새 레코드로 다시 만든다
+- 보관된 레코드는 검색 / 일괄 조회 / export 의 scope='archive' 와 admin 에서 조회
+"""
+from django.db import transaction
+from django.db.models import Count
+
+from .db import BATCH_SIZE, _delete_ids, retry_on_lock
+from .incremental import forget
+from .models import CourseModality, CourseModalityArchive
+from .normalize import format_term
+from .terms import active_term, closed_terms_q
+from .versioning import bump_data_version
+
+# 그대로 복사할 필드 (archive 전용 필드 제외)
+ARCHIVE_FIELDS = [f.name for f in CourseModalityArchive._meta.concrete_fields
+                  if f.name not in ('id', 'original_id', 'archived_at')]
+
+
+def closed_terms(before):
+    """before 이전 학기별 레코드 수: [(학기 이름, 건수), ...] (오래된 학기부터)."""
+    rows = (CourseModality.objects.filter(closed_terms_q(before)).order_by()
+            .values_list('term_year', 'term_semester').annotate(n=Count('id')))
+    return [(format_term(year, semester), n) for year, semester, n in sorted(rows, key=lambda r: (r[0], r[1] or 0))]
+
+
+def _move(ids):
+    with transaction.atomic():
+        rows = CourseModality.objects.filter(id__in=ids).values('id', *ARCHIVE_FIELDS)
+        objs = [CourseModalityArchive(original_id=row['id'], **{f: row[f] for f in ARCHIVE_FIELDS}) for row in rows]
+        CourseModalityArchive.objects.bulk_create(objs, batch_size=BATCH_SIZE)
+        _delete_ids(CourseModality, ids)
+        forget('course', {obj.korean_name for obj in objs})
+    return len(objs)
+
+
+def archive_courses(before=None, dry_run=False):
+    """
+    before((term_year, term_semester), 기본: 현재 학기)보다 이전 학기 레코드를 보관하고
+    {'before': 학기 이름, 'terms': [(학기 이름, 건수), ...], 'archived': 옮긴 건수} 반환.
+    학기를 알 수 없는 레코드(term_year 가 없는 레코드)는 옮기지 않는다.
+    """
+    before = before or active_term()
+    if before is None:
+        return {'before': '', 'terms': [], 'archived': 0}
+    result = {'before': format_term(*before), 'terms': closed_terms(before), 'archived': 0}
+    if dry_run:
+        return result
+
+    closed = CourseModality.objects.filter(closed_terms_q(before)).order_by('id').values_list('id', flat=True)
+    try:
+        while True:
+            ids = list(closed[:BATCH_SIZE])
+            if not ids:
+                break
+            result['archived'] += retry_on_lock(lambda: _move(ids))
+    finally:
+        if result['archived']:
+            bump_data_version(CourseModality, CourseModalityArchive)
+    return result
@@ -0,0 +1,127 @@
+"""
+여러 파일 / zip / 여러 시트 한 번에 업로드.
+- 업로드 파일들을 소스(파일 x 시트) 목록으로 펼침 (zip 안의 .xlsx / .csv 포함)
+- 소스별 파싱 + 정규화(ingest.parse_source)는 ProcessPoolExecutor 에서 병렬로
+- DB 병합은 이 프로세스 하나(single writer)가 소스 순서대로 (청크별 트랜잭션, 증분 업로드 규칙 동일)
+- 병합할 행이 처음 나오면 kind 의 파일 hash 삭제 -> 이후 단일 파일 업로드가 '같은 파일'로 거부되지 않는다
+- 결과: 소스별 요약 + 전체 합계 + 처리량(rows/s)
+"""
+import io
+import os
+import time
+import zipfile
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_context
+
+from django.conf import settings
+
+from .incremental import RowFilter, forget_file
+from .ingest import parse_source, sheet_names
+from .merge import empty_summary, merge_courses, merge_faculty_frame
+from .metrics import registry
+
+SOURCE_SUFFIXES = ('.xlsx', '.csv')
+
+
+def _file_sources(label, filename, data):
+    """(label, filename, data, sheet) 목록. xlsx 는 시트마다 하나."""
+    f = io.BytesIO(data)
+    f.name = filename
+    sheets = sheet_names(f)
+    if len(sheets) == 1:
+        return [(label, filename, data, sheets[0])]
+    return [(f'{label} [{sheet}]', filename, data, sheet) for sheet in sheets]
+
+
+def expand_sources(files):
+    """
+    업로드 파일들 -> (소스 목록, 오류 목록).
+    소스: (label, filename, data, sheet), 오류: {'source', 'error'}
+    """
+    sources, errors = [], []
+
+    def add(label, filename, data):
+        try:
+            sources.extend(_file_sources(label, filename, data))
+        except Exception as exc:
+            errors.append({'source': label, 'error': f'{type(exc).__name__}: {exc}'})
+
+    for f in files:
+        name = getattr(f, 'name', 'upload')
+        data = f.read()
+        if name.lower().endswith('.zip'):
+            try:
+                with zipfile.ZipFile(io.BytesIO(data)) as zf:
+                    for info in zf.infolist():
+                        member = info.filename
+                        base = os.path.basename(member)
+                        if info.is_dir() or member.startswith('__MACOSX/') or base.startswith(('.', '~$')):
+                            continue
+                        if base.lower().endswith(SOURCE_SUFFIXES):
+                            add(f'{name}/{member}', base, zf.read(info))
+            except zipfile.BadZipFile as exc:
+                errors.append({'source': name, 'error': f'BadZipFile: {exc}'})
+        elif name.lower().endswith(SOURCE_SUFFIXES):
+            add(name, name, data)
+        else:
+            errors.append({'source': name, 'error': '지원하지 않는 파일 형식입니다 (.xlsx, .csv, .zip)'})
+    return sources, errors
+
+
+def _parse_all(kind, sources, workers):
+    """소스 순서대로 parse_source 결과를 하나씩 반환 (workers > 1 이면 별도 프로세스에서 병렬 파싱)."""
+    args = [(kind, filename, data, sheet) for _, filename, data, sheet in sources]
+    if workers <= 1 or len(sources) <= 1:
+        for a in args:
+            yield parse_source(*a)
+        return
+    # spawn: 웹 서버(멀티스레드) 프로세스를 fork 하지 않도록. worker 는 pandas/openpyxl 만 사용
+    with ProcessPoolExecutor(max_workers=workers, mp_context=get_context('spawn')) as pool:
+        yield from pool.map(parse_source, *zip(*args))
+
+
+def ingest_files(kind, files, force=False, workers=None):
+    """
+    kind('faculty' / 'course') 파일들을 병렬로 파싱하고 소스 순서대로 병합.
+    반환: {'sources': [{'source', 'rows', 'inserted', 'updated', 'unchanged', 'skipped', 'parse_seconds', 'error'}, ...],
+           'summary', 'rows', 'seconds', 'rows_per_second', 'workers'}
+    """
+    start = time.perf_counter()
+    sources, errors = expand_sources(files)
+    workers = workers or getattr(settings, 'INGEST_WORKERS', None) or os.cpu_count() or 1
+    workers = max(1, min(workers, len(sources)))
+
+    rows_filter = RowFilter(kind, force)
+    total, report, rows = empty_summary(), [], 0
+    file_forgotten = False
+    for (label, *_), parsed in zip(sources, _parse_all(kind, sources, workers)):
+        summary = empty_summary()
+        summary['skipped'] = parsed['skipped']
+        for frame in parsed['frames']:
+            frame, unchanged, digests = rows_filter.split(frame)
+            if len(frame) and not file_forgotten:
+                forget_file(kind)
+                file_forgotten = True
+            result = merge_faculty_frame(frame) if kind == 'faculty' else merge_courses(frame)
+            result['unchanged'] += unchanged
+            for key, value in result.items():
+                summary[key] += value
+            rows_filter.remember(digests)
+        for key, value in summary.items():
+            total[key] += value
+        rows += parsed['rows']
+        report.append({'source': label, 'rows': parsed['rows'], **summary,
+                       'parse_seconds': round(parsed['seconds'], 3), 'error': parsed['error']})
+    report += [{'source': e['source'], 'rows': 0, **empty_summary(), 'parse_seconds': 0, 'error': e['error']}
+               for e in errors]
+
+    registry.inc('dlc_rows_ingested_total', rows, kind=kind)
+    seconds = time.perf_counter() - start
+    return {
+        'sources': report,
+        'summary': total,
+        'rows': rows,
+        'seconds': round(seconds, 3),
+        'rows_per_second': round(rows / seconds, 1) if seconds else None,
+        'workers': workers,
+    }
@@ -0,0 +1,484 @@
+"""
+core view 벤치마크 (manage.py bench 에서 사용).
+- KDIS 규모의 가상(synthetic) Faculty / Course 엑셀을 만들어 Django test client 로 각 view 를 호출
+- 시나리오마다 wall time, 쿼리 수, (tracemalloc) 최대 메모리를 측정
+- 결과는 JSON 으로 저장하고 이전 결과(baseline)와 비교
+- 대량 업로드 중 동시 course_apply 부하 테스트 (manage.py loadtest_apply 에서 사용)
+- web worker 시작 시간 / 메모리(RSS) 측정 (새 프로세스에서 Django + URLconf 로드)
+"""
+import io
+import json
+import os
+import random
+import shutil
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.db import connection, connections
+from django.test import Client
+from django.test.utils import override_settings, setup_test_environment, teardown_test_environment
+from openpyxl import Workbook
+
+from .archive import archive_courses
+from .middleware import _QueryStats
+from .models import CourseModality, CourseModalityArchive, Faculty, RowFingerprint, UploadFingerprint, UploadJob
+from .versioning import bump_data_version
+from .views import ADMIN_PIN
+
+FAMILY = [('김', 'Kim'), ('이', 'Lee'), ('박', 'Park'), ('최', 'Choi'), ('정', 'Jung'), ('강', 'Kang'),
+          ('조', 'Cho'), ('윤', 'Yoon'), ('장', 'Jang'), ('임', 'Lim'), ('한', 'Han'), ('오', 'Oh'),
+          ('서', 'Seo'), ('신', 'Shin'), ('권', 'Kwon'), ('황', 'Hwang'), ('안', 'Ahn'), ('송', 'Song'),
+          ('류', 'Ryu'), ('홍', 'Hong')]
+GIVEN = [('민', 'min'), ('서', 'seo'), ('준', 'jun'), ('우', 'woo'), ('진', 'jin'), ('현', 'hyun'),
+         ('지', 'ji'), ('수', 'su'), ('영', 'young'), ('호', 'ho'), ('성', 'sung'), ('은', 'eun'),
+         ('재', 'jae'), ('하', 'ha'), ('윤', 'yoon'), ('혜', 'hye'), ('경', 'kyung'), ('선', 'sun'),
+         ('미', 'mi'), ('정', 'jung')]
+
+# _get_field / column plan 의 대체 매칭을 거치도록 일부러 지저분하게 만든 헤더
+COURSE_HEADERS = ['Korean name', 'Instructor', 'english_name', 'YEAR ', 'semester', 'Language',
+                  'Course_Title', 'Time Slot', 'Day', 'Time', 'Frequency (Week)', 'Course format',
+                  'Apply this semester', 'Reason', 'PIN']
+FACULTY_HEADERS = ['Korean_name', 'English_name', 'Category', 'Email']
+
+SEARCHES = 50
+EDITS = 30
+
+
+def make_names(n, seed=0):
+    """서로 다른 (한글 이름, 영문 이름) n 개. 두 글자 이름(8,000개)을 먼저 쓰고 모자라면 세 글자 이름."""
+    rng = random.Random(seed)
+    g = len(GIVEN)
+    two = g * g * len(FAMILY)
+    picks = rng.sample(range(two), min(n, two))
+    if n > two:
+        picks += [two + i for i in rng.sample(range(g ** 3 * len(FAMILY)), n - two)]
+    names = []
+    for idx in picks:
+        if idx < two:
+            fam, given = FAMILY[idx // (g * g)], [GIVEN[(idx // g) % g], GIVEN[idx % g]]
+        else:
+            idx -= two
+            fam, given = FAMILY[idx // g ** 3], [GIVEN[(idx // (g * g)) % g], GIVEN[(idx // g) % g], GIVEN[idx % g]]
+        kn = fam[0] + ''.join(x[0] for x in given)
+        en = ''.join(x[1] for x in given).capitalize() + ' ' + fam[1]
+        names.append((kn, en))
+    return names
+
+
+def typo(name, rng):
+    """이름 한 글자를 바꾸거나 빼서 정확히 일치하지 않는 검색어를 만든다."""
+    chars = list(name)
+    i = rng.randrange(len(chars))
+    if rng.random() < 0.5 and len(chars) > 2:
+        del chars[i]
+    else:
+        chars[i] = rng.choice(GIVEN)[0] if '가' <= chars[i] <= '힣' else rng.choice('aeiou')
+    return ''.join(chars)
+
+
+def _xlsx(headers, rows):
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet('Sheet1')
+    ws.append(headers)
+    for row in rows:
+        ws.append(row)
+    buf = io.BytesIO()
+    wb.save(buf)
+    return buf.getvalue()
+
+
+def faculty_workbook(names, seed=0):
+    rng = random.Random(seed)
+    return _xlsx(FACULTY_HEADERS, [
+        [kn, en, rng.choice(['전임', '초빙', '겸임']), f'{en.split()[0].lower()}{i}@kdis.ac.kr']
+        for i, (kn, en) in enumerate(names)
+    ])
+
+
+def course_workbook(names, seed=0, edits=0):
+    """edits: 앞에서부터 edits 개 행의 Course Title 을 바꾼 (증분 업로드용) 워크북."""
+    rng = random.Random(seed)
+    rows = []
+    for i, (kn, en) in enumerate(names):
+        rows.append([
+            kn, kn, en, rng.choice([2025, '2025', 2026.0]), rng.choice(['Spring', 'Fall', '1', '2']),
+            rng.choice(['English', 'Korean']), f'Course {i}' + (' (edited)' if i < edits else ''), rng.choice(['A', 'B', 'C']),
+            rng.choice(['Mon', 'Tue', 'Wed', 'Thu', 'Fri']), '09:00-12:00', rng.choice([1.0, 2.0, '1']),
+            rng.choice(['Offline', 'Online', 'Hybrid']), rng.choice(['Yes', 'No', None]),
+            rng.choice(['', 'Overseas participants', None]),
+            float(rng.randrange(1000, 9999)),  # 엑셀에서 숫자로 읽히는 4자리 비밀번호
+        ])
+    return _xlsx(COURSE_HEADERS, rows)
+
+
+def enrich_workbook(names, seed=0):
+    rng = random.Random(seed)
+    rows = [[kn if rng.random() < 0.8 else typo(kn, rng)] for kn, _ in names]
+    return _xlsx(['Korean_name'], rows)
+
+
+def _upload(name, data):
+    f = io.BytesIO(data)
+    f.name = name
+    return f
+
+
+def _reset():
+    """
+    시나리오 사이에 모든 테이블을 비운다. 테이블마다 DELETE 한 문장만 실행하고
+    (id 조회 / 청크 삭제 / 증분 hash 정리 없이) 데이터 버전은 마지막에 한 번 갱신.
+    """
+    qn = connection.ops.quote_name
+    with connection.cursor() as cursor:
+        for model in (RowFingerprint, UploadFingerprint, UploadJob, CourseModalityArchive, CourseModality, Faculty):
+            cursor.execute('DELETE FROM %s' % qn(model._meta.db_table))
+    bump_data_version(Faculty, CourseModality, CourseModalityArchive)
+
+
+class Dataset:
+    """rows 행 규모의 시나리오 입력 데이터 (한 번만 생성)."""
+
+    def __init__(self, rows, seed=0):
+        self.rows = rows
+        self.names = make_names(rows, seed)
+        self.faculty = faculty_workbook(self.names, seed)
+        self.course = course_workbook(self.names, seed)
+        self.course_edited = course_workbook(self.names, seed, edits=EDITS)
+        self.enrich = enrich_workbook(self.names, seed)
+        rng = random.Random(seed)
+        sample = rng.sample(self.names, min(SEARCHES, len(self.names)))
+        self.search_misses = [typo(kn if i % 2 else en, rng) for i, (kn, en) in enumerate(sample)]
+
+
+def _seed_faculty(client, ds):
+    client.post('/faculty/upload/', {'file': _upload('faculty.xlsx', ds.faculty), 'admin_pin': ADMIN_PIN})
+
+
+def _seed_course(client, ds):
+    client.post('/course/upload/', {'file': _upload('course.xlsx', ds.course), 'admin_pin': ADMIN_PIN})
+
+
+def _seed_course_admin(client, ds):
+    _seed_course(client, ds)
+    user, _ = get_user_model().objects.get_or_create(username='bench', defaults={'is_staff': True, 'is_superuser': True})
+    client.force_login(user)
+
+
+ADMIN_CHANGELIST = '/admin/core/coursemodality/'
+ADMIN_FILTERS = [{'term_year': '2025'}, {'term_semester__exact': '3'}, {'apply_this_semester__exact': '1'},
+                 {'term_year': '2025', 'term_semester__exact': '1', 'apply_this_semester__exact': '0'}]
+
+
+def _admin_pages(client, ds):
+    """이름 접두어 검색 + 필터별로 1, 2 페이지."""
+    for kn, _ in ds.names[:SEARCHES]:
+        client.get(ADMIN_CHANGELIST, {'q': kn[:2]})
+    for params in ADMIN_FILTERS:
+        for page in (1, 2):
+            client.get(ADMIN_CHANGELIST, {**params, 'p': page})
+
+
+def _admin_action(client, action, **params):
+    """changelist 의 '전체 선택(select_across)' 상태로 action 실행."""
+    query = '&'.join(f'{k}={v}' for k, v in params.items())
+    # 브라우저처럼 현재 페이지에서 체크된 id 도 함께 보낸다 (select_across 이면 무시되지만 비어 있으면 action 이 실행되지 않음)
+    page = CourseModality.objects.values_list('pk', flat=True)[:1]
+    return client.post(f'{ADMIN_CHANGELIST}?{query}',
+                       {'action': action, 'select_across': '1', 'index': '0', '_selected_action': list(page)})
+
+
+def _export(client, fmt):
+    """PIN POST -> 다운로드 URL 로 redirect -> 파일 내용."""
+    return b''.join(client.post('/course/admin_export/', {'admin_pin': ADMIN_PIN, 'format': fmt}, follow=True).streaming_content)
+
+
+# 시나리오: name -> (setup(client, ds), run(client, ds))
+SCENARIOS = {
+    'faculty_upload': (
+        lambda c, ds: None,
+        lambda c, ds: c.post('/faculty/upload/', {'file': _upload('faculty.xlsx', ds.faculty), 'admin_pin': ADMIN_PIN}),
+    ),
+    'faculty_upload_repeat': (
+        _seed_faculty,
+        lambda c, ds: c.post('/faculty/upload/', {'file': _upload('faculty.xlsx', ds.faculty), 'admin_pin': ADMIN_PIN}),
+    ),
+    'course_upload': (
+        lambda c, ds: None,
+        lambda c, ds: c.post('/course/upload/', {'file': _upload('course.xlsx', ds.course), 'admin_pin': ADMIN_PIN}),
+    ),
+    'course_upload_repeat': (
+        _seed_course,
+        lambda c, ds: c.post('/course/upload/', {'file': _upload('course.xlsx', ds.course), 'admin_pin': ADMIN_PIN}),
+    ),
+    'course_upload_edited': (
+        _seed_course,
+        lambda c, ds: c.post('/course/upload/', {'file': _upload('course.xlsx', ds.course_edited), 'admin_pin': ADMIN_PIN}),
+    ),
+    'course_upload_force': (
+        _seed_course,
+        lambda c, ds: c.post('/course/upload/', {'file': _upload('course.xlsx', ds.course), 'admin_pin': ADMIN_PIN, 'force': 'on'}),
+    ),
+    'faculty_enrich_upload': (
+        _seed_faculty,
+        lambda c, ds: c.post('/faculty/enrich/', {'file': _upload('names.xlsx', ds.enrich), 'fuzzy_fill': '1'}),
+    ),
+    'faculty_search_miss': (
+        _seed_faculty,
+        lambda c, ds: [c.get('/faculty/search/', {'name': q}) for q in ds.search_misses],
+    ),
+    'course_search_miss': (
+        _seed_course,
+        lambda c, ds: [c.get('/course/search/', {'name': q}) for q in ds.search_misses],
+    ),
+    'course_admin_export': (
+        _seed_course,
+        lambda c, ds: _export(c, 'xlsx'),
+    ),
+    'course_admin_export_csv': (
+        _seed_course,
+        lambda c, ds: _export(c, 'csv'),
+    ),
+    'course_admin_export_snapshot': (
+        lambda c, ds: (_seed_course(c, ds), _export(c, 'xlsx')),
+        lambda c, ds: _export(c, 'xlsx'),
+    ),
+    'course_admin_changelist': (
+        _seed_course_admin,
+        _admin_pages,
+    ),
+    'course_admin_bulk_apply': (
+        _seed_course_admin,
+        lambda c, ds: (_admin_action(c, 'mark_apply', term_year='2025'),
+                       _admin_action(c, 'cancel_apply', term_semester__exact='3')),
+    ),
+    'course_admin_export_selection': (
+        _seed_course_admin,
+        lambda c, ds: b''.join(_admin_action(c, 'export_selection', term_year='2025').streaming_content),
+    ),
+    'course_search_miss_all_terms': (
+        _seed_course,
+        lambda c, ds: [c.get('/course/search/', {'name': q, 'scope': 'all'}) for q in ds.search_misses],
+    ),
+    'course_archive': (
+        _seed_course,
+        lambda c, ds: archive_courses(),
+    ),
+}
+
+
+@contextmanager
+def bench_database():
+    """
+    실제 파일 기반 임시 SQLite DB 로 전환 (기본 테스트 DB 는 in-memory). 운영 DB 는 건드리지 않는다.
+    export 스냅샷도 임시 디렉터리에 만든다.
+    """
+    tmpdir = tempfile.mkdtemp(prefix='dlc-bench-')
+    connection.settings_dict.setdefault('TEST', {})['NAME'] = os.path.join(tmpdir, 'bench.sqlite3')
+    setup_test_environment()
+    old_name = connection.creation.create_test_db(verbosity=0, autoclobber=True)
+    try:
+        with override_settings(EXPORT_SNAPSHOT_DIR=os.path.join(tmpdir, 'exports')):
+            yield
+    finally:
+        connection.creation.destroy_test_db(old_name, verbosity=0)
+        teardown_test_environment()
+        shutil.rmtree(tmpdir, ignore_errors=True)
+
+
+def _measure(name, ds, memory):
+    setup, run = SCENARIOS[name]
+    client = Client()
+    _reset()
+    setup(client, ds)
+    queries = _QueryStats()
+    if memory:
+        tracemalloc.start()
+    try:
+        # queries_log(CaptureQueriesContext) 는 최대 9,000 건만 보관 -> execute_wrapper 로 직접 센다
+        with connection.execute_wrapper(queries):
+            start = time.perf_counter()
+            run(client, ds)
+            seconds = time.perf_counter() - start
+    finally:
+        peak = tracemalloc.get_traced_memory()[1] if memory else None
+        if memory:
+            tracemalloc.stop()
+    return seconds, queries.count, peak
+
+
+def run_benchmarks(sizes, scenarios=None, memory=True, log=print):
+    """
+    sizes(행 수) x scenarios 조합을 실행하고 결과 dict 목록을 반환.
+    시간/쿼리 수는 tracemalloc 없이 한 번, 메모리는 tracemalloc 을 켠 별도 실행에서 측정.
+    """
+    results = []
+    for rows in sizes:
+        ds = Dataset(rows)
+        for name in scenarios or SCENARIOS:
+            seconds, queries, _ = _measure(name, ds, memory=False)
+            peak = _measure(name, ds, memory=True)[2] if memory else None
+            result = {
+                'scenario': name,
+                'rows': rows,
+                'seconds': round(seconds, 4),
+                'queries': queries,
+                'peak_mb': round(peak / 2 ** 20, 2) if peak is not None else None,
+            }
+            log(result)
+            results.append(result)
+    _reset()
+    return results
+
+
+# 새 프로세스에서 실행: Django 설정 + middleware + URLconf(모든 view 모듈) 로드까지의 시간과 최대 RSS
+# (ru_maxrss 는 fork/exec 후에도 부모의 최대값이 남으므로 /proc/self/status 의 VmHWM 을 읽는다)
+STARTUP_SCRIPT = """
+import json, sys, time
+start = time.perf_counter()
+import django
+django.setup()
+from django.core.handlers.wsgi import WSGIHandler
+from django.urls import get_resolver
+WSGIHandler()
+get_resolver().url_patterns
+for name in sys.argv[1:]:
+    __import__(name)
+seconds = time.perf_counter() - start
+with open('/proc/self/status') as f:
+    status = dict(line.split(':', 1) for line in f)
+print(json.dumps({
+    'seconds': seconds,
+    'rss_mb': int(status['VmHWM'].split()[0]) / 1024,
+    'heavy_modules': sorted(m for m in ('pandas', 'numpy', 'rapidfuzz', 'openpyxl') if m in sys.modules),
+}))
+"""
+
+# startup: 신청/조회 폼만 처리하는 worker, startup_full: 업로드/fuzzy 모듈까지 로드한 worker (비교용)
+STARTUP_VARIANTS = {
+    'startup': [],
+    'startup_full': ['core.uploads', 'core.search_index', 'core.resolve'],
+}
+
+
+def measure_startup(repeat=3, log=print):
+    """STARTUP_VARIANTS 별로 새 프로세스를 repeat 번 띄워 가장 빠른 시간 / RSS 를 결과 dict 로 반환."""
+    env = dict(os.environ, DJANGO_SETTINGS_MODULE=os.environ.get('DJANGO_SETTINGS_MODULE', 'dlc_operation.settings'))
+    results = []
+    for name, modules in STARTUP_VARIANTS.items():
+        runs = []
+        for _ in range(repeat):
+            out = subprocess.run([sys.executable, '-c', STARTUP_SCRIPT, *modules], cwd=settings.BASE_DIR, env=env,
+                                 check=True, capture_output=True, text=True).stdout
+            runs.append(json.loads(out.strip().splitlines()[-1]))
+        best = min(runs, key=lambda r: r['seconds'])
+        result = {
+            'scenario': name,
+            'rows': 0,
+            'seconds': round(best['seconds'], 4),
+            'queries': 0,
+            'peak_mb': round(min(r['rss_mb'] for r in runs), 2),  # 최대 RSS
+            'heavy_modules': best['heavy_modules'],
+        }
+        log(result)
+        results.append(result)
+    return results
+
+
+def compare(results, baseline, tolerance=0.2):
+    """
+    baseline 결과와 비교한 행 목록과 회귀(regression) 여부 반환.
+    시간/메모리가 tolerance 이상 늘거나 쿼리 수가 늘면 회귀로 본다.
+    """
+    base = {(r['scenario'], r['rows']): r for r in baseline}
+    lines, regressed = [], False
+    for r in results:
+        b = base.get((r['scenario'], r['rows']))
+        if not b:
+            continue
+        flags = []
+        if r['seconds'] > b['seconds'] * (1 + tolerance):
+            flags.append('time')
+        if r['queries'] > b['queries']:
+            flags.append('queries')
+        if r.get('peak_mb') and b.get('peak_mb') and r['peak_mb'] > b['peak_mb'] * (1 + tolerance):
+            flags.append('memory')
+        regressed = regressed or bool(flags)
+        lines.append(
+            f"{r['scenario']:<26} {r['rows']:>7} rows  "
+            f"{b['seconds']:>8.3f}s -> {r['seconds']:>8.3f}s  "
+            f"{b['queries']:>6} -> {r['queries']:>6} queries"
+            + (f"  REGRESSION({', '.join(flags)})" if flags else '')
+        )
+    return lines, regressed
+
+
+def run_apply_load_test(rows, applies, log=print):
+    """
+    course_upload(rows 행) 가 실행되는 동안 applies 개의 스레드가 동시에 course_apply 저장을 POST.
+    (업로드 파일의 Apply 값이 신청 결과를 다시 덮어쓸 수 있으므로 성공 여부는 응답으로 판단)
+    반환: {'rows', 'applies', 'saved', 'failed', 'errors', 'upload_seconds', 'apply_p50_ms', 'apply_max_ms'}
+    """
+    ds = Dataset(rows)
+    _reset()
+    _seed_course(Client(), ds)
+    targets = list(CourseModality.objects.order_by('?').values_list('id', 'password')[:applies])
+    # 업로드 파일: 기존 행 변경 + 새 행 추가가 섞이도록 다른 seed 로 생성
+    upload = course_workbook(make_names(rows + rows // 2, seed=1), seed=1)
+    start_line = threading.Barrier(len(targets) + 1)
+    timings, saved, errors = [], [], []
+    result = {}
+
+    def do_upload():
+        try:
+            start_line.wait()
+            start = time.perf_counter()
+            Client().post('/course/upload/', {'file': _upload('course.xlsx', upload), 'admin_pin': ADMIN_PIN})
+            result['upload_seconds'] = round(time.perf_counter() - start, 3)
+        finally:
+            connections.close_all()
+
+    def do_apply(pk, password):
+        try:
+            start_line.wait()
+            time.sleep(random.random() * 0.5)  # 업로드가 쓰기를 시작한 뒤에 겹치도록 분산
+            start = time.perf_counter()
+            resp = Client().post(f'/course/apply/{pk}/', {
+                'record_password': password, 'reason_for_applying': 'Overseas participants', 'save': '1',
+            })
+            timings.append(time.perf_counter() - start)
+            if resp.status_code == 200 and 'has been saved' in resp.content.decode():
+                saved.append(pk)
+            else:
+                errors.append(f'{pk}: HTTP {resp.status_code}')
+        except Exception as exc:  # 'database is locked' 등
+            errors.append(f'{pk}: {exc}')
+        finally:
+            connections.close_all()
+
+    threads = [threading.Thread(target=do_upload)]
+    threads += [threading.Thread(target=do_apply, args=t) for t in targets]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    timings.sort()
+    result.update({
+        'rows': rows,
+        'applies': len(targets),
+        'saved': len(saved),
+        'failed': len(errors),
+        'errors': errors[:10],
+        'apply_p50_ms': round(timings[len(timings) // 2] * 1000, 1) if timings else None,
+        'apply_max_ms': round(timings[-1] * 1000, 1) if timings else None,
+    })
+    log(result)
+    _reset()
+    return result
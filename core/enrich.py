@@ -0,0 +1,60 @@
+"""
+Faculty Enrich: Korean_name 리스트에 English_name / Category / Email 을 채워 넣는다.
+- Faculty 조회는 korean_name IN (...) 청크 쿼리로 한 번에
+- 결과는 DataFrame left merge 로 조립 (입력 행 순서 유지)
+"""
+import pandas as pd
+
+from .fuzzy import best_matches
+from .db import in_chunks
+from .models import Faculty
+
+ENRICH_COLUMNS = ['Korean_name', 'English_name', 'Category', 'Email']
+
+
+def _lookup_frame(names):
+    rows = []
+    for chunk in in_chunks(names):
+        rows.extend(
+            Faculty.objects.filter(korean_name__in=chunk)
+            .values_list('korean_name', 'english_name', 'category', 'email')
+        )
+    return pd.DataFrame(rows, columns=ENRICH_COLUMNS)
+
+
+def _enrich_chunk(df):
+    names = df['Korean_name']
+    names = names.where(names.notna(), '').astype(str).str.strip()
+    wanted = set(names) - {''}
+    lookup = _lookup_frame(wanted)
+    out = pd.DataFrame({'Korean_name': names.to_numpy()})
+    out = out.merge(lookup, on='Korean_name', how='left')
+    return out.astype(object).where(out.notna(), ''), wanted - set(lookup['Korean_name'])
+
+
+def enrich_faculty(frames, fuzzy_fill=False):
+    """
+    frames(Korean_name 컬럼이 있는 DataFrame 청크들) 기준으로 보완된 DataFrame 반환.
+    - 컬럼: No(1..n), No(빈 값), Korean_name, English_name, Category, Email (기존 엑셀 양식 그대로)
+    - Korean_name 이 빈 행은 모든 값이 빈 행으로 출력
+    - fuzzy_fill=True 이면 정확히 일치하는 교원이 없는 이름에 대해
+      가장 비슷한 교원 이름과 점수를 'Fuzzy_match' 컬럼에 추가
+    """
+    parts, misses = [], set()
+    for df in frames:
+        part, missed = _enrich_chunk(df)
+        parts.append(part)
+        misses |= missed
+    out = pd.concat(parts, ignore_index=True) if parts else pd.DataFrame(columns=ENRICH_COLUMNS)
+
+    if fuzzy_fill:
+        misses = sorted(misses)
+        choices = list(Faculty.objects.values_list('korean_name', flat=True))
+        matches = dict(zip(misses, best_matches(misses, choices)))
+        out['Fuzzy_match'] = [
+            f'{matches[n][0]} ({matches[n][1]:.0f})' if matches.get(n) else '' for n in out['Korean_name']
+        ]
+
+    out.insert(0, 'No', '', allow_duplicates=True)
+    out.insert(0, 'No', range(1, len(out) + 1), allow_duplicates=True)
+    return out
@@ -0,0 +1,227 @@
+"""
+Course Modality 관리자 엑셀/CSV 다운로드.
+- DB 에서 values_list(...).iterator(chunk_size) 로 조금씩 읽어서 바로 파일에 기록
+  (xlsx: openpyxl write-only 워크북, csv: 한 행씩) -> 전체 테이블을 메모리에 올리지 않는다.
+- 기본은 현재 학기(core/terms.py) 레코드, scope 로 전체 / 보관된 학기(CourseModalityArchive) 선택
+- 파일은 (데이터 버전, 형식, Year/Semester 필터, scope)별 스냅샷으로 디스크에 만들어 두고
+  데이터가 바뀌기 전까지는 그 파일을 FileResponse 로 그대로 보낸다 (snapshot_response).
+- admin 에서 선택한 레코드만 내려받을 때는 스냅샷 없이 CSV 로 바로 스트리밍 (selection_response).
+"""
+import csv
+import hashlib
+import os
+import tempfile
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+from django.conf import settings
+from django.http import FileResponse, StreamingHttpResponse
+
+from .metrics import registry
+from .models import CourseModality, CourseModalityArchive
+from .normalize import term_semester, term_year
+from .terms import active_term_label, scoped_courses
+from .versioning import get_data_version
+
+CHUNK_SIZE = 2000
+XLSX_CONTENT_TYPE = 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet'
+EXPORT_FILENAME = 'course_modality_export'
+
+# (엑셀 헤더, 모델 필드) — 'Name' 컬럼은 export 에서 제외
+EXPORT_COLUMNS = [
+    ('No', 'id'),
+    ('Korean_name', 'korean_name'),
+    ('English_name', 'english_name'),
+    ('Year', 'year'),
+    ('Semester', 'semester'),
+    ('Language', 'language'),
+    ('Course Title', 'course_title'),
+    ('Time Slot', 'time_slot'),
+    ('Day', 'day'),
+    ('Time', 'time'),
+    ('Frequency(Week)', 'frequency_week'),
+    ('Course format', 'course_format'),
+    ('Apply this semester(Online 70)', 'apply_this_semester'),
+    ('Reason for Applying', 'reason_for_applying'),
+    ('Modified Date', 'modified_date'),
+    ('password', 'password'),
+]
+EXPORT_HEADERS = [h for h, _ in EXPORT_COLUMNS]
+_APPLY_POS = EXPORT_HEADERS.index('Apply this semester(Online 70)')
+_DATE_POS = EXPORT_HEADERS.index('Modified Date')
+
+
+def _export_fields(model):
+    fields = [f for _, f in EXPORT_COLUMNS]
+    if model is CourseModalityArchive:
+        fields[0] = 'original_id'  # 보관된 레코드의 'No' 는 원래 레코드 번호
+    return fields
+
+
+def iter_export_rows(queryset=None, chunk_size=CHUNK_SIZE, kind='course_xlsx'):
+    """export 할 행(list)을 id 순서로 하나씩 생성."""
+    if queryset is None:
+        queryset = CourseModality.objects.all()
+    values = queryset.order_by('id').values_list(*_export_fields(queryset.model))
+    count = 0
+    for rec in values.iterator(chunk_size=chunk_size):
+        row = list(rec)
+        row[_APPLY_POS] = 'Yes' if row[_APPLY_POS] else 'No'
+        row[_DATE_POS] = row[_DATE_POS].isoformat() if row[_DATE_POS] else ''
+        count += 1
+        yield row
+    registry.inc('dlc_rows_exported_total', count, kind=kind)
+
+
+def write_xlsx(rows, fileobj, headers=EXPORT_HEADERS):
+    """rows 를 write-only 워크북으로 fileobj 에 저장 (첫 행은 굵은 글씨 headers)."""
+    from openpyxl import Workbook  # 스냅샷을 새로 만들 때만 로드
+    from openpyxl.cell import WriteOnlyCell
+    from openpyxl.styles import Font
+
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet('Sheet1')
+    header = []
+    for h in headers:
+        cell = WriteOnlyCell(ws, value=h)
+        cell.font = Font(bold=True)
+        header.append(cell)
+    ws.append(header)
+    for row in rows:
+        ws.append(row)
+    wb.save(fileobj)
+
+
+class _Echo:
+    """csv.writer 가 쓴 한 줄을 그대로 돌려주는 pseudo-buffer."""
+
+    def write(self, value):
+        return value
+
+
+def _iter_csv(rows):
+    writer = csv.writer(_Echo())
+    yield '\ufeff'  # 엑셀에서 한글이 깨지지 않도록 UTF-8 BOM
+    yield writer.writerow(EXPORT_HEADERS)
+    for row in rows:
+        yield writer.writerow(row)
+
+
+# -----------------------------
+# 스냅샷 (데이터 버전별 export 파일)
+# -----------------------------
+STALE_TMP_SECONDS = 3600
+SNAPSHOT_FORMATS = {
+    'xlsx': XLSX_CONTENT_TYPE,
+    'csv': 'text/csv; charset=utf-8',
+}
+
+
+def _snapshot_dir():
+    return Path(settings.EXPORT_SNAPSHOT_DIR)
+
+
+def export_queryset(year='', semester='', scope='current'):
+    """
+    Year / Semester 를 주면 (scope 가 archive 가 아니면 CourseModality 전체에서) 그 학기,
+    없으면 scope 범위 전체. Year / Semester 는 정규화된 학기(term_year / term_semester)로 비교
+    ('Fall' 과 '2' 는 같은 학기), 알아볼 수 없는 값이면 입력 그대로 비교.
+    """
+    if not (year or semester):
+        return scoped_courses(scope)
+    queryset = scoped_courses('archive' if scope == 'archive' else 'all')
+    if year:
+        value = term_year(year)
+        queryset = queryset.filter(term_year=value) if value else queryset.filter(year=year)
+    if semester:
+        value = term_semester(semester)
+        queryset = queryset.filter(term_semester=value) if value else queryset.filter(semester=semester)
+    return queryset
+
+
+def _data_version():
+    return get_data_version(CourseModality, CourseModalityArchive)
+
+
+def _filter_digest(fmt, year, semester, scope):
+    # 현재 학기 범위는 ACTIVE_TERM 설정이 바뀌어도 다른 스냅샷이 되도록 학기 이름도 포함
+    term = active_term_label() if scope == 'current' and not (year or semester) else ''
+    return hashlib.sha1(f'{fmt}\x1f{year}\x1f{semester}\x1f{scope}\x1f{term}'.encode()).hexdigest()[:12]
+
+
+def snapshot_etag(fmt, year='', semester='', scope='current'):
+    """스냅샷 식별자: 데이터 버전 + (형식, 필터, scope) hash."""
+    return f'{_data_version()}-{_filter_digest(fmt, year, semester, scope)}'
+
+
+def snapshot_path(fmt, year='', semester='', scope='current'):
+    return _snapshot_dir() / f'{EXPORT_FILENAME}-{snapshot_etag(fmt, year, semester, scope)}.{fmt}'
+
+
+def snapshot_last_modified(fmt, year='', semester='', scope='current'):
+    """현재 버전 스냅샷 파일의 수정 시각 (아직 없으면 None)."""
+    try:
+        return datetime.fromtimestamp(snapshot_path(fmt, year, semester, scope).stat().st_mtime, tz=timezone.utc)
+    except FileNotFoundError:
+        return None
+
+
+def _write_snapshot(path, fmt, year, semester, scope):
+    rows = iter_export_rows(export_queryset(year, semester, scope), kind=f'course_{fmt}')
+    fd, tmp = tempfile.mkstemp(dir=path.parent, suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            if fmt == 'csv':
+                for line in _iter_csv(rows):
+                    f.write(line.encode('utf-8'))
+            else:
+                write_xlsx(rows, f)
+        os.replace(tmp, path)  # 다른 요청이 같은 스냅샷을 만들고 있어도 완성된 파일만 보인다
+    except BaseException:
+        os.unlink(tmp)
+        raise
+
+
+def _cleanup_snapshots(version):
+    """version 이 아닌(이전 데이터 버전의) 스냅샷과 오래된 임시 파일 삭제."""
+    stale_tmp = time.time() - STALE_TMP_SECONDS
+    for path in _snapshot_dir().iterdir():
+        if path.suffix == '.tmp':
+            remove = path.stat().st_mtime < stale_tmp  # 다른 요청이 아직 쓰는 중일 수 있음
+        else:
+            remove = not path.name.startswith(f'{EXPORT_FILENAME}-{version}-')
+        if remove:
+            try:
+                path.unlink()
+            except FileNotFoundError:
+                pass
+
+
+def open_snapshot(fmt, year='', semester='', scope='current'):
+    """현재 데이터 버전의 스냅샷 파일을 열어서 반환. 없으면 만들고 이전 버전 스냅샷은 정리한다."""
+    version = _data_version()
+    path = _snapshot_dir() / f'{EXPORT_FILENAME}-{version}-{_filter_digest(fmt, year, semester, scope)}.{fmt}'
+    built = not path.exists()
+    if built:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        _write_snapshot(path, fmt, year, semester, scope)
+    f = open(path, 'rb')
+    if built:
+        _cleanup_snapshots(version)
+    registry.inc('dlc_export_snapshots_total', kind=fmt, result='built' if built else 'reused')
+    return f
+
+
+def snapshot_response(fmt, year='', semester='', scope='current'):
+    suffix = ''.join(f'_{v}' for v in (year, semester) if v) or ('' if scope == 'current' else f'_{scope}')
+    return FileResponse(open_snapshot(fmt, year, semester, scope), as_attachment=True,
+                        filename=f'{EXPORT_FILENAME}{suffix}.{fmt}', content_type=SNAPSHOT_FORMATS[fmt])
+
+
+def selection_response(queryset):
+    """queryset(admin 에서 선택한 레코드)을 스냅샷 없이 CSV 로 스트리밍."""
+    response = StreamingHttpResponse(_iter_csv(iter_export_rows(queryset, kind='course_selection')),
+                                     content_type=SNAPSHOT_FORMATS['csv'])
+    response['Content-Disposition'] = f'attachment; filename="{EXPORT_FILENAME}_selection.csv"'
+    return response
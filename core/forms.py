@@ -1,11 +1,66 @@
 from django import forms
 
+from .terms import SCOPE_CHOICES
+
 class UploadFileForm(forms.Form):
     file = forms.FileField(required=True)
     admin_pin = forms.CharField(required=True, max_length=10, widget=forms.PasswordInput)
+    background = forms.BooleanField(required=False, label='Process in background (대용량 파일)')
+    force = forms.BooleanField(required=False, label='Reprocess all rows (변경 없는 행/같은 파일도 다시 병합)')
+
+class MultipleFileInput(forms.FileInput):
+    """<input type="file" multiple> (Django 4.2.0 의 FileInput 은 파일 하나만 읽으므로 getlist 로 직접 읽음)."""
+    allow_multiple_selected = True
+
+    def __init__(self, attrs=None):
+        super().__init__({'multiple': True, **(attrs or {})})
+
+    def value_from_datadict(self, data, files, name):
+        return files.getlist(name) if hasattr(files, 'getlist') else files.get(name)
+
+class MultipleFileField(forms.FileField):
+    """여러 파일 선택 (cleaned_data 는 파일 list)."""
+
+    def __init__(self, *args, **kwargs):
+        kwargs.setdefault('widget', MultipleFileInput())
+        super().__init__(*args, **kwargs)
+
+    def clean(self, data, initial=None):
+        single = super().clean
+        if isinstance(data, (list, tuple)):
+            return [single(d, initial) for d in data]
+        return [single(data, initial)]
+
+class MultiUploadForm(forms.Form):
+    kind = forms.ChoiceField(choices=[('course', 'Course Modality'), ('faculty', 'Faculty')], initial='course')
+    files = MultipleFileField(label='Files (.xlsx / .csv / .zip, 여러 개 선택 가능)')
+    admin_pin = forms.CharField(required=True, max_length=10, widget=forms.PasswordInput)
+    force = forms.BooleanField(required=False, label='Reprocess all rows (변경 없는 행도 다시 병합)')
 
 class SimpleSearchForm(forms.Form):
     name = forms.CharField(required=True, label='Korean or English name')
 
+class CourseSearchForm(SimpleSearchForm):
+    scope = forms.ChoiceField(choices=SCOPE_CHOICES, required=False, initial='current', label='Semester')
+
 class ApplyPasswordForm(forms.Form):
     record_password = forms.CharField(required=True, max_length=10, widget=forms.PasswordInput, label='4-digit password')
+
+class BatchResolveForm(forms.Form):
+    names = forms.CharField(required=False, widget=forms.Textarea(attrs={'rows': 10}), label='Names (한 줄에 하나)')
+    file = forms.FileField(required=False, label='또는 엑셀/CSV 파일 (Korean_name 컬럼, 없으면 첫 번째 컬럼)')
+    target = forms.ChoiceField(choices=[('faculty', 'Faculty'), ('course', 'Course Modality')], initial='faculty')
+    limit = forms.IntegerField(min_value=1, max_value=10, initial=3, label='Top-k')
+    score_cutoff = forms.IntegerField(min_value=0, max_value=100, initial=70, label='Minimum score')
+    scope = forms.ChoiceField(choices=SCOPE_CHOICES, required=False, initial='current', label='Semester (Course Modality)')
+    output = forms.ChoiceField(choices=[('xlsx', 'Excel'), ('json', 'JSON')], initial='xlsx')
+
+    def clean(self):
+        cleaned = super().clean()
+        if not cleaned.get('names', '').strip() and not cleaned.get('file'):
+            raise forms.ValidationError('이름을 입력하거나 파일을 업로드하세요.')
+        return cleaned
+
+class BatchLookupForm(forms.Form):
+    names = forms.CharField(widget=forms.Textarea(attrs={'rows': 10}), label='Instructor names (한 줄에 하나)')
+    scope = forms.ChoiceField(choices=SCOPE_CHOICES, required=False, initial='current', label='Semester')
@@ -0,0 +1,65 @@
+"""
+rapidfuzz 기반 배치(batch) fuzzy 이름 매칭.
+- 여러 이름을 한 번에 process.cdist 로 점수 계산 (workers=-1: 모든 코어 사용)
+- 점수 행렬은 CHUNK_ROWS 행 단위로 계산하고 바로 버려서 메모리를 제한
+"""
+import numpy as np
+from rapidfuzz import fuzz, process
+
+CHUNK_ROWS = 500
+
+
+def best_matches(queries, choices, score_cutoff=70, scorer=fuzz.ratio):
+    """
+    queries 의 각 이름에 대해 choices 중 가장 점수가 높은 (choice, score) 를 반환.
+    score_cutoff 미만이면 None. (process.extractOne 과 같은 기준)
+    """
+    queries = list(queries)
+    choices = list(choices)
+    results = [None] * len(queries)
+    if not queries or not choices:
+        return results
+    for start in range(0, len(queries), CHUNK_ROWS):
+        scores = process.cdist(
+            queries[start:start + CHUNK_ROWS], choices,
+            scorer=scorer, score_cutoff=score_cutoff, workers=-1,
+        )
+        best = scores.argmax(axis=1)
+        for i, j in enumerate(best):
+            score = float(scores[i, j])
+            if score > 0 and score >= score_cutoff:
+                results[start + i] = (choices[j], score)
+    return results
+
+
+def _row_top(row, limit):
+    """점수 한 행에서 0 보다 큰 상위 limit 개의 인덱스 (점수 내림차순, 동점이면 앞 순서)."""
+    if limit < len(row):
+        kth = row[np.argpartition(-row, limit - 1)[limit - 1]]
+        pos = np.flatnonzero(row >= max(kth, np.finfo(row.dtype).tiny))
+    else:
+        pos = np.flatnonzero(row > 0)
+    return pos[np.lexsort((pos, -row[pos]))][:limit]
+
+
+def top_matches(queries, choices, limit=3, score_cutoff=70, scorer=fuzz.ratio):
+    """
+    queries 의 각 이름에 대해 choices 중 점수가 높은 순서로 [(choice, score), ...] 최대 limit 개 반환.
+    score_cutoff 미만은 제외 (없으면 빈 리스트). limit=1 이면 best_matches 와 같은 결과.
+    """
+    queries = list(queries)
+    choices = list(choices)
+    results = [[] for _ in queries]
+    if not queries or not choices or limit < 1:
+        return results
+    for start in range(0, len(queries), CHUNK_ROWS):
+        scores = process.cdist(
+            queries[start:start + CHUNK_ROWS], choices,
+            scorer=scorer, score_cutoff=score_cutoff, workers=-1,
+        )
+        for i, row in enumerate(scores):
+            results[start + i] = [
+                (choices[j], float(row[j])) for j in _row_top(row, limit) if row[j] >= score_cutoff
+            ]
+        del scores
+    return results
@@ -0,0 +1,124 @@
+"""
+증분(incremental) 업로드.
+- 파일 sha256 을 종류(kind)별로 저장: 마지막에 처리한 파일과 같으면 바로 거부
+- Korean_name 별로 정규화된 행 값의 hash 를 저장: hash 가 같은 행은 병합하지 않고 '변경 없음'으로 셈
+- 업로드 밖에서 레코드가 바뀌면(관리자 수정, 신청/취소, 삭제) 해당 hash 를 지워서
+  다음 업로드 때 그 행은 다시 병합된다 (예전처럼 파일 값이 반영됨)
+- 여러 레코드를 한 번에 지울 때(admin 일괄 삭제)는 delete_records: 청크별 DELETE + hash 삭제 / 버전 갱신 한 번
+"""
+import hashlib
+
+from django.db import transaction
+
+from .db import BATCH_SIZE, _delete_ids, in_chunks
+from .models import CourseModality, Faculty, RowFingerprint, UploadFingerprint
+from .versioning import bump_data_version
+
+BLOCK_SIZE = 1 << 20
+
+MODEL_KINDS = {Faculty: 'faculty', CourseModality: 'course'}
+
+
+def file_sha256(f):
+    """파일 전체의 sha256 (읽은 뒤 처음 위치로 되돌림)."""
+    h = hashlib.sha256()
+    for block in iter(lambda: f.read(BLOCK_SIZE), b''):
+        h.update(block)
+    f.seek(0)
+    return h.hexdigest()
+
+
+def is_duplicate_file(kind, sha256):
+    return UploadFingerprint.objects.filter(kind=kind, sha256=sha256).exists()
+
+
+def remember_file(kind, sha256, rows):
+    UploadFingerprint.objects.update_or_create(kind=kind, defaults={'sha256': sha256, 'rows': rows})
+
+
+def _delete_if_any(queryset):
+    # 지울 hash 가 없으면(대부분의 신청/취소 저장) 쓰기 문장 없이 읽기만
+    if queryset.exists():
+        queryset.delete()
+
+
+def forget_file(kind):
+    """kind 의 파일 hash 삭제 (레코드가 바뀌었으므로 다음 업로드는 같은 파일이라도 처리)."""
+    _delete_if_any(UploadFingerprint.objects.filter(kind=kind))
+
+
+def forget(kind, names=None):
+    """kind 의 파일 hash 와 names(없으면 전체)의 행 hash 를 삭제."""
+    forget_file(kind)
+    rows = RowFingerprint.objects.filter(kind=kind)
+    if names is None:
+        _delete_if_any(rows)
+        return
+    for chunk in in_chunks(names):
+        _delete_if_any(rows.filter(korean_name__in=chunk))
+
+
+def delete_records(queryset):
+    """
+    queryset 레코드를 청크별 DELETE 로 삭제하고 QuerySet.delete() 와 같은 (건수, {모델: 건수}) 반환.
+    post_delete signal 을 행마다 보내지 않고, 증분 업로드 hash 삭제와 데이터 버전 갱신은 한 번만 한다.
+    """
+    model = queryset.model
+    rows = list(queryset.order_by().values_list('id', 'korean_name'))
+    if not rows:
+        return 0, {}
+    with transaction.atomic():
+        for chunk in in_chunks([pk for pk, _ in rows]):
+            _delete_ids(model, chunk)
+        if model in MODEL_KINDS:
+            forget(MODEL_KINDS[model], {name for _, name in rows})
+    bump_data_version(model)
+    return len(rows), {model._meta.label: len(rows)}
+
+
+class RowFilter:
+    """
+    업로드 한 번 동안 청크별로 바뀐 행만 골라낸다.
+    같은 Korean_name 의 행들은 한 묶음으로 hash (청크 안에서 위에서부터 순서대로).
+    여러 청크에 나오는 이름은 두 번째 청크부터 항상 병합하고 hash 를 저장하지 않는다.
+    """
+
+    def __init__(self, kind, force=False):
+        self.kind = kind
+        self.force = force
+        self.seen = set()
+
+    def _digests(self, frame):
+        hashes = {}
+        for row in frame.itertuples(index=False):
+            name = row.korean_name
+            if not name:
+                continue
+            hashes.setdefault(name, hashlib.sha1()).update('\x1f'.join(map(str, row)).encode() + b'\x1e')
+        return {name: h.hexdigest() for name, h in hashes.items()}
+
+    def split(self, frame):
+        """(병합할 행 frame, 건너뛴(변경 없는) 행 수, 저장할 {name: digest}) 반환."""
+        digests = self._digests(frame)
+        repeated = {n for n in digests if n in self.seen}
+        self.seen.update(digests)
+        for name in repeated:
+            digests.pop(name)
+        unchanged = set()
+        if not self.force and digests:
+            for chunk in in_chunks(digests):
+                unchanged.update(
+                    name for name, digest in RowFingerprint.objects.filter(kind=self.kind, korean_name__in=chunk)
+                    .values_list('korean_name', 'digest') if digests[name] == digest
+                )
+        if not unchanged:
+            return frame, 0, digests
+        keep = ~frame['korean_name'].isin(unchanged)
+        return frame[keep], int((~keep).sum()), {n: d for n, d in digests.items() if n not in unchanged}
+
+    def remember(self, digests):
+        RowFingerprint.objects.bulk_create(
+            [RowFingerprint(kind=self.kind, korean_name=n, digest=d) for n, d in digests.items()],
+            batch_size=BATCH_SIZE, update_conflicts=True,
+            unique_fields=['kind', 'korean_name'], update_fields=['digest'],
+        )
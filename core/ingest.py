@@ -0,0 +1,264 @@
+"""
+업로드 엑셀 파싱 helper.
+- 업로드 파일(xlsx / csv)을 고정 크기 청크(DataFrame) 단위로 읽기(iter_frames)
+- 셀 값 정규화(_norm_cell, _parse_bool_cell: core/normalize.py 의 순수 Python 구현)
+- 헤더 -> 필드 매핑(column plan): 파일(헤더 구성)당 한 번만 계산하고 캐시
+- column plan 에 따라 컬럼 단위로 필드 값을 추출
+- 파일/시트 하나를 정규화된 DataFrame 으로 만드는 parse_source (병렬 수집용, Django 에 의존하지 않음)
+"""
+import io
+import time
+from functools import lru_cache
+
+import pandas as pd
+from openpyxl import load_workbook
+
+from .normalize import norm_cell as _norm_cell, parse_bool_cell as _parse_bool_cell
+
+CHUNK_ROWS = 2000
+
+
+def _header_names(cells):
+    """pd.read_excel 과 같은 컬럼명: 빈 헤더 -> 'Unnamed: i', 중복 -> 'a.1', 'a.2' ..."""
+    names, seen = [], {}
+    for i, value in enumerate(cells):
+        name = f'Unnamed: {i}' if value is None or value == '' else value
+        if name in seen:
+            seen[name] += 1
+            name = f'{name}.{seen[name]}'
+        else:
+            seen[name] = 0
+        names.append(name)
+    return names
+
+
+def _iter_xlsx_frames(f, chunk_size, sheet=None):
+    wb = load_workbook(f, read_only=True, data_only=True)
+    try:
+        ws = wb[sheet] if sheet is not None else wb.worksheets[0]
+        rows = ws.iter_rows(values_only=True)
+        header = _header_names(next(rows, ()))
+        width = len(header)
+        chunk, blanks, start = [], [], 0
+        yielded = False
+        for row in rows:
+            row = (tuple(row) + (None,) * width)[:width]
+            # 완전히 빈 행은 뒤에 데이터가 있을 때만 포함 (read_excel 처럼 끝의 빈 행은 버림)
+            if all(v is None for v in row):
+                blanks.append(row)
+                continue
+            chunk.extend(blanks)
+            blanks = []
+            chunk.append(row)
+            if len(chunk) >= chunk_size:
+                yield pd.DataFrame(chunk, columns=header, index=range(start, start + len(chunk)), dtype=object)
+                start += len(chunk)
+                chunk = []
+                yielded = True
+        if chunk or not yielded:
+            yield pd.DataFrame(chunk, columns=header, index=range(start, start + len(chunk)), dtype=object)
+    finally:
+        wb.close()
+
+
+def iter_frames(f, chunk_size=CHUNK_ROWS, sheet=None):
+    """
+    업로드 파일을 chunk_size 행씩 DataFrame(dtype=object)으로 읽는다.
+    - .csv: pandas C parser (chunksize)
+    - 그 외(.xlsx): openpyxl read_only 모드로 sheet(기본: 첫 번째 시트)를 한 행씩 읽음
+    데이터 행이 없어도 헤더만 있는 빈 DataFrame 을 한 번은 반환한다.
+    """
+    if getattr(f, 'name', '').lower().endswith('.csv'):
+        return iter(pd.read_csv(f, chunksize=chunk_size, dtype=object, encoding='utf-8-sig'))
+    return _iter_xlsx_frames(f, chunk_size, sheet)
+
+
+def sheet_names(f):
+    """xlsx 의 시트 이름 목록 (csv 는 [None])."""
+    if getattr(f, 'name', '').lower().endswith('.csv'):
+        return [None]
+    wb = load_workbook(f, read_only=True)
+    try:
+        return list(wb.sheetnames)
+    finally:
+        wb.close()
+        f.seek(0)
+
+
+# -----------------------------
+# Faculty 업로드: 엑셀 컬럼명 -> Faculty 필드
+# -----------------------------
+FACULTY_COLUMNS = {
+    'Korean_name': 'korean_name',
+    'English_name': 'english_name',
+    'Category': 'category',
+    'Email': 'email',
+}
+
+
+def normalize_faculty_frame(df):
+    """
+    Faculty 업로드 시트를 정규화하여 (frame, skipped) 반환.
+    - 필요한 4개 컬럼만 남기고 NaN -> '', 앞뒤 공백 제거
+    - Korean_name 이 비어 있는 행은 제외(skipped)
+    - 같은 Korean_name 이 여러 번 나오면 마지막 행 기준(기존 update_or_create 순차 처리와 동일)
+    """
+    frame = df.reindex(columns=list(FACULTY_COLUMNS)).rename(columns=FACULTY_COLUMNS)
+    frame = frame.astype(object).where(frame.notna(), '')
+    frame = frame.apply(lambda col: col.astype(str).str.strip())
+    blank = frame['korean_name'] == ''
+    frame = frame[~blank].drop_duplicates(subset='korean_name', keep='last')
+    return frame, int(blank.sum())
+
+
+# -----------------------------
+# Course Modality 업로드: 필드별 후보 헤더명 (앞에 있을수록 우선)
+# -----------------------------
+COURSE_FIELD_CANDIDATES = {
+    'korean_name': ['Korean_name', 'Korean name', 'korean_name', 'name_kr', 'Name(KR)', 'Name'],
+    'name': ['Name', 'name', 'Instructor', 'Instructor Name'],
+    'english_name': ['English_name', 'English name', 'english_name'],
+    'year': ['Year', 'year'],
+    'semester': ['Semester', 'semester'],
+    'language': ['Language', 'language'],
+    'course_title': ['Course Title', 'Course_Title', 'course_title', 'Title'],
+    'time_slot': ['Time Slot', 'Time_Slot', 'time_slot'],
+    'day': ['Day', 'day'],
+    'time': ['Time', 'time'],
+    'frequency_week': ['Frequency(Week)', 'Frequency', 'Frequency (Week)', 'Frequency Week', 'frequency_week'],
+    'course_format': ['Course format', 'Course_format', 'course_format'],
+    'apply_this_semester': ['Apply this semester(Online 70)', 'Apply this semester', 'Apply', 'Apply_this_semester'],
+}
+
+# password / reason 은 부분 문자열 매칭 없이, 후보명 또는 소문자 키 일치만 허용
+COURSE_STRICT_CANDIDATES = {
+    'password': (
+        ['password', 'Password', 'PASSWORD', 'pin', 'PIN', 'pass', 'Pass', 'PIN_code', 'password_code'],
+        ('password', 'pin', 'pass'),
+    ),
+    'reason_for_applying': (
+        ['Reason for Applying', 'Reason', 'reason_for_applying', 'reason', 'Reason_for_Applying'],
+        ('reason for applying', 'reason', 'reason_for_applying'),
+    ),
+}
+
+COURSE_TEXT_FIELDS = [f for f in COURSE_FIELD_CANDIDATES if f != 'apply_this_semester']
+
+
+def _dedupe(columns):
+    seen = []
+    for c in columns:
+        if c not in seen:
+            seen.append(c)
+    return tuple(seen)
+
+
+def _match_columns(columns, candidates):
+    """
+    candidates 에 매칭되는 컬럼들을 우선순위 순서로 반환.
+    (예전 _get_field 의 탐색 순서와 동일)
+    1) 정확한 후보명
+    2) 소문자/공백 보정 후 일치
+    3) 후보 단어가 헤더에 포함(또는 그 반대)
+    """
+    matched = [c for c in candidates if c in columns]
+    lowmap = {str(k).strip().lower(): k for k in columns if k is not None}
+    for c in candidates:
+        key = c.strip().lower()
+        if key in lowmap:
+            matched.append(lowmap[key])
+    for k in columns:
+        if k is None or str(k) == '':
+            continue
+        kk = str(k).strip().lower()
+        for c in candidates:
+            cc = c.strip().lower()
+            if cc in kk or kk in cc:
+                matched.append(k)
+                break
+    return _dedupe(matched)
+
+
+def _match_strict_columns(columns, candidates, keys):
+    matched = [c for c in candidates if c in columns]
+    matched += [k for k in columns if k is not None and str(k).strip().lower() in keys]
+    return _dedupe(matched)
+
+
+@lru_cache(maxsize=64)
+def _course_plan(signature):
+    plan = {fld: _match_columns(signature, cands) for fld, cands in COURSE_FIELD_CANDIDATES.items()}
+    for fld, (cands, keys) in COURSE_STRICT_CANDIDATES.items():
+        plan[fld] = _match_strict_columns(signature, cands, keys)
+    return plan
+
+
+def build_course_plan(columns):
+    """
+    업로드 시트의 헤더(df.columns)로 column plan 을 만든다.
+    반환: {필드명: (컬럼, 대체 컬럼, ...)} — 앞 컬럼이 비어 있는 셀은 다음 컬럼 값으로 채움.
+    같은 헤더 구성(템플릿)은 캐시된 plan 을 그대로 재사용.
+    """
+    return _course_plan(tuple(columns))
+
+
+def describe_plan(plan):
+    """업로드 결과 화면용: [{'field', 'column', 'fallbacks'}, ...]"""
+    return [
+        {'field': fld, 'column': str(cols[0]) if cols else '', 'fallbacks': ', '.join(str(c) for c in cols[1:])}
+        for fld, cols in plan.items()
+    ]
+
+
+def _norm_column(series):
+    return series.map(_norm_cell).astype(object)
+
+
+def _coalesce(df, columns):
+    """columns 순서대로, 비어 있지 않은 첫 번째 값을 취한 Series."""
+    result = pd.Series('', index=df.index, dtype=object)
+    for col in reversed(columns):
+        values = _norm_column(df[col])
+        result = values.where(values != '', result)
+    return result
+
+
+def extract_course_frame(df, plan):
+    """
+    column plan 에 따라 필드 값을 컬럼 단위로 추출한 DataFrame 반환.
+    - 텍스트 필드/password/reason_for_applying: 정규화된 문자열('' = 없음)
+    - apply_this_semester: True / False / None
+    """
+    out = pd.DataFrame(index=df.index)
+    for fld in COURSE_TEXT_FIELDS + list(COURSE_STRICT_CANDIDATES):
+        out[fld] = _coalesce(df, plan[fld])
+    out['apply_this_semester'] = _coalesce(df, plan['apply_this_semester']).map(_parse_bool_cell).astype(object)
+    return out
+
+
+def parse_source(kind, filename, data, sheet=None):
+    """
+    파일(bytes) 한 개의 시트 하나를 읽고 정규화 (ProcessPoolExecutor worker 에서 실행).
+    반환: {'frames': [정규화된 DataFrame 청크, ...], 'skipped', 'rows', 'plan', 'seconds', 'error'}
+    - faculty: normalize_faculty_frame 결과 (청크별)
+    - course: extract_course_frame 결과 (청크별)
+    """
+    start = time.perf_counter()
+    result = {'frames': [], 'skipped': 0, 'rows': 0, 'plan': None, 'seconds': 0.0, 'error': ''}
+    try:
+        f = io.BytesIO(data)
+        f.name = filename
+        for chunk in iter_frames(f, sheet=sheet):
+            result['rows'] += len(chunk)
+            if kind == 'faculty':
+                frame, skipped = normalize_faculty_frame(chunk)
+                result['skipped'] += skipped
+            else:
+                plan = build_course_plan(chunk.columns)
+                result['plan'] = describe_plan(plan)
+                frame = extract_course_frame(chunk, plan)
+            result['frames'].append(frame)
+    except Exception as exc:
+        result['error'] = f'{type(exc).__name__}: {exc}'
+    result['seconds'] = time.perf_counter() - start
+    return result
@@ -0,0 +1,101 @@
+"""
+업로드 백그라운드 작업.
+- 화면(view)은 파일을 저장하고 UploadJob 만 만든 뒤 바로 응답
+- `python manage.py run_upload_jobs` (같은 서버의 별도 프로세스)가 대기 중인 작업을 처리
+- 진행 상황/오류/소요 시간은 UploadJob 에 기록 -> job_status JSON 으로 조회
+- worker 가 작업 도중 종료되면 작업이 'running' 으로 남는다 -> worker 시작 시 / UPLOAD_JOB_TIMEOUT 이 지나면 실패로 기록
+외부 broker 없이 SQLite 만 사용한다.
+"""
+import logging
+import traceback
+from datetime import timedelta
+
+from django.conf import settings
+from django.utils import timezone
+
+from .models import UploadJob
+
+logger = logging.getLogger(__name__)
+
+STALE_ERROR = '작업이 중단되었습니다 (worker 종료 또는 시간 초과). 파일을 다시 업로드하세요.'
+
+
+def _timeout():
+    return getattr(settings, 'UPLOAD_JOB_TIMEOUT', 3600)
+
+
+def enqueue(kind, uploaded_file, force=False):
+    """업로드 파일을 저장하고 대기(pending) 작업을 만든다."""
+    return UploadJob.objects.create(kind=kind, file=uploaded_file, original_name=uploaded_file.name, force=force)
+
+
+def _claim(job):
+    """다른 worker 가 이미 가져간 작업이면 False."""
+    return UploadJob.objects.filter(pk=job.pk, status='pending').update(
+        status='running', started_at=timezone.now()) == 1
+
+
+def run_job(job):
+    """작업 하나를 처리하고 결과를 기록. 처리했으면 True."""
+    if not _claim(job):
+        return False
+
+    def progress(rows_processed, total_rows):
+        UploadJob.objects.filter(pk=job.pk).update(rows_processed=rows_processed, total_rows=total_rows)
+
+    from .uploads import PROCESSORS  # pandas 는 작업을 처리하는 worker 에서만 로드
+
+    try:
+        with job.file.open('rb') as f:
+            result = PROCESSORS[job.kind](f, progress=progress, force=job.force)
+    except Exception:
+        logger.exception('upload job %s failed', job.pk)
+        UploadJob.objects.filter(pk=job.pk).update(
+            status='failed', error=traceback.format_exc(), finished_at=timezone.now())
+        return True
+
+    UploadJob.objects.filter(pk=job.pk).update(status='done', summary=result, finished_at=timezone.now())
+    job.file.delete(save=False)
+    return True
+
+
+def fail_stale(timeout=None):
+    """
+    'running' 으로 남은 작업을 실패로 기록하고 개수를 반환.
+    timeout(초)이 있으면 그보다 오래 전에 시작한 작업만, None 이면 전부 (worker 시작 시: 이전 worker 의 작업은 끝나지 않는다).
+    """
+    running = UploadJob.objects.filter(status='running')
+    if timeout is not None:
+        running = running.filter(started_at__lt=timezone.now() - timedelta(seconds=timeout))
+    return running.update(status='failed', error=STALE_ERROR, finished_at=timezone.now())
+
+
+def run_pending(limit=None):
+    """시간이 지난 'running' 작업을 실패로 기록한 뒤, 대기 중인 작업을 오래된 순서로 처리하고 처리한 개수를 반환."""
+    fail_stale(_timeout())
+    done = 0
+    while limit is None or done < limit:
+        job = UploadJob.objects.filter(status='pending').order_by('id').first()
+        if job is None:
+            break
+        if run_job(job):
+            done += 1
+    return done
+
+
+def job_status(job):
+    """job_status view 의 JSON 내용. stale: UPLOAD_JOB_TIMEOUT 이 지나도 'running' (worker 가 멈춘 작업)."""
+    elapsed = None
+    if job.started_at:
+        elapsed = ((job.finished_at or timezone.now()) - job.started_at).total_seconds()
+    return {
+        'id': job.id,
+        'kind': job.kind,
+        'status': job.status,
+        'stale': job.status == 'running' and elapsed is not None and elapsed > _timeout(),
+        'rows_processed': job.rows_processed,
+        'total_rows': job.total_rows,
+        'elapsed_seconds': elapsed,
+        'summary': job.summary,
+        'error': job.error.strip().splitlines()[-1] if job.error else '',
+    }
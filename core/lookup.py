@@ -0,0 +1,87 @@
+"""
+여러 이름의 Course Modality 레코드 일괄 조회.
+- 정확 일치: 검색 키(korean_key / english_key) IN (...) 쿼리 한 번 (이름이 아주 많으면 청크 단위)
+- 정확히 일치하지 않은 이름만 fuzzy 매칭 (course_search 와 같은 기준, cdist 로 한 번에)
+- 결과는 입력 이름 순서대로, 이름별로 묶어서 반환 (password / 신청 사유 제외)
+- 검색 범위는 scope (기본: 현재 학기, core/terms.py)
+"""
+from django.db import connection
+from django.db.models import Q
+
+from .fuzzy import best_matches
+from .db import in_chunks
+from .models import CourseModality
+from .normalize import search_key
+from .search_index import SCORE_CUTOFF, get_name_index
+from .terms import archive_row, record_fields, scoped_courses
+
+# 검색 결과 화면과 같은 공개 필드
+LOOKUP_FIELDS = ['id', 'name', 'korean_name', 'english_name', 'year', 'semester', 'language', 'course_title',
+                 'time_slot', 'day', 'time', 'frequency_week', 'course_format']
+MAX_NAMES = 2000
+# IN (...) 외에 scope 조건(terms.term_q)이 쓰는 파라미터 몫
+SCOPE_PARAMS = 8
+
+
+def _param_budget():
+    """한 쿼리에서 IN (...) 에 쓸 수 있는 파라미터 수."""
+    return (connection.features.max_query_params or 999) - SCOPE_PARAMS
+
+
+def _exact(courses, keys, fields, scope):
+    """{검색 키: [레코드 dict, ...]} — korean_key 또는 english_key 가 일치하는 레코드."""
+    found = {}
+    for chunk in in_chunks(keys, _param_budget() // 2):
+        rows = (courses.filter(Q(korean_key__in=chunk) | Q(english_key__in=chunk))
+                .order_by('id').values('korean_key', 'english_key', *fields))
+        wanted = set(chunk)
+        for row in rows:
+            rec = archive_row({f: row[f] for f in fields}, scope)
+            for key in {row['korean_key'], row['english_key']} & wanted:
+                found.setdefault(key, []).append(rec)
+    return found
+
+
+def _records_by_id(courses, ids, fields, scope):
+    records = {}
+    for chunk in in_chunks(set(ids), _param_budget()):
+        for row in courses.filter(id__in=chunk).values(*fields):
+            records[row['id']] = archive_row(row, scope)
+    return records
+
+
+def lookup_courses(names, scope='current'):
+    """
+    names 각각에 대해 {'query', 'match': 'exact' | 'fuzzy' | None, 'matched_name', 'score', 'records'} 반환.
+    fuzzy 결과는 course_search 에서 같은 scope 로 한 이름씩 검색한 결과와 같다.
+    scope='archive' 의 records 는 'archived': True, 'original_id' (원래 레코드 번호) 포함 ('id' 는 보관 테이블의 id).
+    """
+    courses = scoped_courses(scope)
+    fields = record_fields(LOOKUP_FIELDS, scope)
+    queries = [' '.join(n.split()) for n in names]
+    queries = [q for q in queries if q]
+    exact = _exact(courses, set(filter(None, map(search_key, queries))), fields, scope)
+
+    misses = list(dict.fromkeys(q for q in queries if search_key(q) not in exact))
+    fuzzy = {}
+    if misses:
+        index = get_name_index(CourseModality, scope)
+        fuzzy = {q: m for q, m in zip(misses, best_matches(misses, index.names, score_cutoff=SCORE_CUTOFF)) if m}
+        records = _records_by_id(courses, (pk for name, _ in fuzzy.values() for pk in index.ids[name]), fields, scope)
+        fuzzy = {
+            q: (name, score, sorted((records[pk] for pk in index.ids[name] if pk in records), key=lambda r: r['id']))
+            for q, (name, score) in fuzzy.items()
+        }
+
+    results = []
+    for q in queries:
+        key = search_key(q)
+        if key in exact:
+            results.append({'query': q, 'match': 'exact', 'matched_name': q, 'score': 100.0, 'records': exact[key]})
+        elif q in fuzzy:
+            name, score, records = fuzzy[q]
+            results.append({'query': q, 'match': 'fuzzy', 'matched_name': name, 'score': round(score, 1),
+                            'records': records})
+        else:
+            results.append({'query': q, 'match': None, 'matched_name': '', 'score': None, 'records': []})
+    return results
@@ -0,0 +1,29 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from core.archive import archive_courses
+from core.normalize import parse_term
+
+
+class Command(BaseCommand):
+    help = '지난 학기 Course Modality 레코드를 보관 테이블(CourseModalityArchive)로 옮깁니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--before', help='이 학기보다 이전 학기를 보관 (예: "2025 Fall", 기본: 현재 학기)')
+        parser.add_argument('--dry-run', action='store_true', help='옮길 학기와 건수만 출력')
+
+    def handle(self, *args, **options):
+        before = None
+        if options['before']:
+            before = parse_term(options['before'])
+            if None in before:
+                raise CommandError(f"--before {options['before']!r} 에서 연도와 학기를 알 수 없습니다 (예: \"2025 Fall\").")
+        result = archive_courses(before, dry_run=options['dry_run'])
+        if not result['before']:
+            self.stdout.write('학기 정보가 있는 레코드가 없습니다.')
+            return
+        for term, count in result['terms']:
+            self.stdout.write(f'{term}: {count}')
+        if options['dry_run']:
+            self.stdout.write(f"dry run: {result['before']} 이전 {sum(n for _, n in result['terms'])}건")
+        else:
+            self.stdout.write(f"{result['before']} 이전 {result['archived']}건 보관 완료")
@@ -0,0 +1,51 @@
+import json
+import sys
+
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+
+from core.benchmarks import SCENARIOS, bench_database, compare, measure_startup, run_benchmarks
+
+
+class Command(BaseCommand):
+    help = ('core view 벤치마크. 임시 SQLite DB 에 가상 데이터를 만들어 업로드/검색/export 를 측정합니다. '
+            '(운영 DB 는 건드리지 않음)')
+
+    def add_arguments(self, parser):
+        parser.add_argument('--rows', default='1000,10000', help='데이터 규모(행 수), 쉼표로 구분. 예: 1000,10000,100000')
+        parser.add_argument('--scenario', action='append', choices=sorted(SCENARIOS),
+                            help='실행할 시나리오 (여러 번 지정 가능, 기본: 전체)')
+        parser.add_argument('--output', default='bench_results.json', help='결과 JSON 파일')
+        parser.add_argument('--baseline', help='비교할 이전 결과 JSON 파일')
+        parser.add_argument('--tolerance', type=float, default=0.2, help='회귀로 볼 증가 비율 (기본 0.2 = 20%%)')
+        parser.add_argument('--skip-memory', action='store_true', help='tracemalloc 메모리 측정 생략')
+        parser.add_argument('--startup', action='store_true',
+                            help='web worker 시작 시간 / RSS(peak_mb) 도 측정 (startup, startup_full)')
+
+    def handle(self, *args, **options):
+        try:
+            sizes = [int(x) for x in options['rows'].split(',') if x.strip()]
+        except ValueError:
+            raise CommandError('--rows 는 쉼표로 구분한 정수여야 합니다.')
+
+        baseline = None
+        if options['baseline']:
+            with open(options['baseline'], encoding='utf-8') as f:
+                baseline = json.load(f)['results']
+
+        with bench_database():
+            results = run_benchmarks(sizes, options['scenario'], memory=not options['skip_memory'],
+                                     log=lambda r: self.stdout.write(json.dumps(r, ensure_ascii=False)))
+        if options['startup']:
+            results += measure_startup(log=lambda r: self.stdout.write(json.dumps(r, ensure_ascii=False)))
+
+        with open(options['output'], 'w', encoding='utf-8') as f:
+            json.dump({'created': timezone.now().isoformat(), 'rows': sizes, 'results': results}, f, indent=2)
+        self.stdout.write(f"results saved to {options['output']}")
+
+        if baseline is not None:
+            lines, regressed = compare(results, baseline, options['tolerance'])
+            for line in lines:
+                self.stdout.write(line)
+            if regressed:
+                sys.exit(1)
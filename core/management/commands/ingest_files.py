@@ -0,0 +1,32 @@
+import json
+
+from django.core.management.base import BaseCommand, CommandError
+
+from core.batch_ingest import ingest_files
+
+
+class Command(BaseCommand):
+    help = '여러 엑셀/CSV/zip 파일을 병렬로 읽어서 병합합니다. (화면의 Multi-file Upload 와 같은 처리)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('kind', choices=['faculty', 'course'])
+        parser.add_argument('paths', nargs='+', help='.xlsx / .csv / .zip 파일')
+        parser.add_argument('--workers', type=int, help='파싱 프로세스 수 (기본: settings.INGEST_WORKERS 또는 CPU 코어 수)')
+        parser.add_argument('--force', action='store_true', help='변경 없는 행도 다시 병합')
+
+    def handle(self, *args, **options):
+        files = []
+        try:
+            for path in options['paths']:
+                files.append(open(path, 'rb'))
+            report = ingest_files(options['kind'], files, force=options['force'], workers=options['workers'])
+        except OSError as exc:
+            raise CommandError(str(exc))
+        finally:
+            for f in files:
+                f.close()
+        for source in report['sources']:
+            self.stdout.write(json.dumps(source, ensure_ascii=False))
+        self.stdout.write(
+            f"{report['rows']} rows in {report['seconds']}s ({report['rows_per_second']} rows/s, "
+            f"{report['workers']} workers): {report['summary']}")
@@ -0,0 +1,23 @@
+import json
+import sys
+
+from django.core.management.base import BaseCommand
+
+from core.benchmarks import bench_database, run_apply_load_test
+
+
+class Command(BaseCommand):
+    help = ('대량 course 업로드 중 동시 course_apply 부하 테스트. '
+            '임시 SQLite 파일 DB 에서 실행하며, 저장에 실패한 신청이 있으면 exit 1.')
+
+    def add_arguments(self, parser):
+        parser.add_argument('--rows', type=int, default=10000, help='업로드 데이터 규모(행 수)')
+        parser.add_argument('--applies', type=int, default=20, help='동시에 보낼 course_apply 저장 요청 수')
+
+    def handle(self, *args, **options):
+        with bench_database():
+            result = run_apply_load_test(options['rows'], options['applies'],
+                                         log=lambda r: self.stdout.write(json.dumps(r, ensure_ascii=False)))
+        if result['failed'] or result['saved'] != result['applies']:
+            self.stderr.write('some applications were not saved')
+            sys.exit(1)
@@ -0,0 +1,26 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from core.jobs import fail_stale, run_pending
+
+
+class Command(BaseCommand):
+    help = '대기 중인 업로드 작업(UploadJob)을 처리합니다. 기본은 계속 대기하면서 처리, --once 는 한 번만.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--once', action='store_true', help='대기 중인 작업만 처리하고 종료')
+        parser.add_argument('--interval', type=float, default=2.0, help='새 작업 확인 간격(초)')
+
+    def handle(self, *args, **options):
+        # 이전 worker 가 처리하던 중에 종료된 작업 (worker 는 하나만 실행)
+        stale = fail_stale()
+        if stale:
+            self.stdout.write(f'{stale} interrupted job(s) marked as failed')
+        while True:
+            done = run_pending()
+            if done:
+                self.stdout.write(f'{done} job(s) processed')
+            if options['once']:
+                break
+            time.sleep(options['interval'])
@@ -0,0 +1,194 @@
+"""
+엑셀 업로드 병합(merge) 엔진.
+- 시트(또는 청크) 전체를 한 번에(벡터 연산으로) 정규화
+- 기존 레코드는 korean_name 기준으로 한 번에 조회
+  (Course 는 같은 이름이라도 학기(term_year, term_semester)가 다르면 다른 레코드 -> 새 학기 행은 새 레코드로 추가)
+- 신규/변경 레코드는 bulk_create / bulk_update 로 하나의 트랜잭션 안에서 반영
+- bulk 경로는 save() 를 거치지 않으므로 검색 키(korean_key / english_key)와
+  Course 의 학기(term_year / term_semester)를 직접 채운다
+"""
+import itertools
+
+from django.db import transaction
+from django.utils import timezone
+
+from .db import BATCH_SIZE, _bulk_update, in_chunks
+from .ingest import COURSE_TEXT_FIELDS
+from .models import CourseModality, Faculty
+from .normalize import term_semester, term_year
+from .versioning import bump_data_version
+
+FACULTY_FIELDS = ['english_name', 'category', 'email']
+
+
+def fetch_by_names(queryset, names, field='korean_name'):
+    """
+    names에 해당하는 레코드를 field 기준으로 조회하여 리스트로 반환.
+    이름 수가 많으면 IN 쿼리를 여러 번(청크 단위)으로 나눠 실행한다.
+    """
+    rows = []
+    for chunk in in_chunks(set(names)):
+        rows.extend(queryset.filter(**{f'{field}__in': chunk}))
+    return rows
+
+
+def empty_summary():
+    return {'inserted': 0, 'updated': 0, 'unchanged': 0, 'skipped': 0}
+
+
+def merge_faculty_frame(frame, skipped=0):
+    """
+    normalize_faculty_frame() 결과(frame, skipped)를 Faculty 에 병합하고 요약(dict)을 반환.
+    반환: {'inserted', 'updated', 'unchanged', 'skipped'}
+    """
+    summary = empty_summary()
+    summary['skipped'] = skipped
+
+    with transaction.atomic():
+        existing = {f.korean_name: f for f in fetch_by_names(Faculty.objects.all(), frame['korean_name'])}
+        to_create, to_update = [], []
+        for rec in frame.to_dict('records'):
+            obj = existing.get(rec['korean_name'])
+            if obj is None:
+                to_create.append(Faculty(**rec))
+                continue
+            changed = False
+            for fld in FACULTY_FIELDS:
+                if getattr(obj, fld) != rec[fld]:
+                    setattr(obj, fld, rec[fld])
+                    changed = True
+            if changed:
+                to_update.append(obj)
+            else:
+                summary['unchanged'] += 1
+
+        for obj in itertools.chain(to_create, to_update):
+            obj.set_search_keys()
+        Faculty.objects.bulk_create(to_create, batch_size=BATCH_SIZE)
+        Faculty.objects.bulk_update(to_update, FACULTY_FIELDS + ['english_key'], batch_size=BATCH_SIZE)
+    if to_create or to_update:
+        bump_data_version(Faculty)
+
+    summary['inserted'] = len(to_create)
+    summary['updated'] = len(to_update)
+    return summary
+
+
+def _latest(objs):
+    return max(objs, key=lambda obj: (obj.term_year or 0, obj.term_semester or 0), default=None)
+
+
+def _match_course(objs, term):
+    """
+    같은 Korean_name 의 레코드(objs) 중 term((term_year, term_semester)) 행이 병합될 레코드. 없으면 None (새 레코드).
+    - 학기가 같은 레코드
+    - 행의 학기를 일부만 알면(Year 빈 칸 / Semester 빈 칸) 그 범위에서 가장 최근 학기 레코드
+    - 없으면 학기를 알 수 없는 예전 레코드 (term_q 와 같은 기준, 이번 행의 학기로 채워짐)
+    """
+    year, semester = term
+    if year is None:
+        return _latest(objs)
+    for obj in objs:
+        if (obj.term_year, obj.term_semester) == term:
+            return obj
+    if semester is None:
+        match = _latest([obj for obj in objs if obj.term_year == year])
+        if match is not None:
+            return match
+    return next((obj for obj in objs if obj.term_year is None or (obj.term_year == year and obj.term_semester is None)),
+                None)
+
+
+def merge_courses(frame):
+    """
+    extract_course_frame() 결과를 CourseModality 에 병합하고 요약(dict)을 반환.
+    기존 행 단위 get_or_create 병합 규칙을 메모리에서 그대로 적용한다.
+    - (Korean_name, 학기)로 기존 레코드를 찾음 (_match_course): 다른 학기 행은 새 레코드
+      -> 지난 학기의 신청(Apply) / 신청 이유가 새 학기 레코드로 넘어가지 않는다
+    - 빈 값('')은 기존 값을 덮어쓰지 않음
+    - modified_date 는 reason / apply 값이 실제로 바뀔 때만 갱신
+    - 같은 Korean_name 이 여러 번 나오면 위에서부터 차례로 병합
+    """
+    summary = empty_summary()
+    now = timezone.now()
+    fields = [f for f in COURSE_TEXT_FIELDS if f != 'korean_name']
+
+    with transaction.atomic():
+        state = {}
+        for obj in fetch_by_names(CourseModality.objects.order_by('id'), frame['korean_name']):
+            state.setdefault(obj.korean_name, []).append(obj)
+        matched = set()
+        to_create, dirty, changed_fields = [], {}, set()
+
+        for rec in frame.to_dict('records'):
+            kn = rec['korean_name']
+            if not kn:
+                summary['skipped'] += 1
+                continue
+            reason = rec['reason_for_applying']
+            apply_flag = rec['apply_this_semester']
+
+            objs = state.setdefault(kn, [])
+            obj = _match_course(objs, (term_year(rec['year']), term_semester(rec['semester'])))
+            if obj is None:
+                obj = CourseModality(korean_name=kn, **{fld: rec[fld] for fld in fields})
+                if rec['password'] != '':
+                    obj.password = rec['password']
+                if reason != '':
+                    obj.reason_for_applying = reason
+                if apply_flag is not None:
+                    obj.apply_this_semester = bool(apply_flag)
+                if reason != '' or apply_flag is not None:
+                    obj.modified_date = now
+                obj.set_term()
+                objs.append(obj)
+                to_create.append(obj)
+                continue
+
+            changed = []
+            for fld in fields:
+                val = rec[fld]
+                if val != '' and getattr(obj, fld) != val:
+                    setattr(obj, fld, val)
+                    changed.append(fld)
+            if reason != '' and obj.reason_for_applying != reason:
+                obj.reason_for_applying = reason
+                changed += ['reason_for_applying', 'modified_date']
+            if apply_flag is not None and obj.apply_this_semester != bool(apply_flag):
+                obj.apply_this_semester = bool(apply_flag)
+                changed += ['apply_this_semester', 'modified_date']
+            if 'modified_date' in changed:
+                obj.modified_date = now
+            if 'year' in changed or 'semester' in changed:
+                obj.set_term()
+            pw = rec['password']
+            if pw != '' and obj.password != pw:
+                obj.password = pw
+                changed.append('password')
+
+            if obj.pk is None:
+                continue
+            matched.add(obj.pk)
+            if changed:
+                dirty[obj.pk] = obj
+                changed_fields.update(changed)
+
+        for obj in itertools.chain(to_create, dirty.values()):
+            obj.set_search_keys()
+            obj.set_term()
+        if 'english_name' in changed_fields:
+            changed_fields.add('english_key')
+        if 'year' in changed_fields:
+            changed_fields.add('term_year')
+        if 'semester' in changed_fields:
+            changed_fields.add('term_semester')
+        CourseModality.objects.bulk_create(to_create, batch_size=BATCH_SIZE)
+        if dirty:
+            _bulk_update(CourseModality, dirty.values(), sorted(changed_fields))
+    if to_create or dirty:
+        bump_data_version(CourseModality)
+
+    summary['inserted'] = len(to_create)
+    summary['updated'] = len(dirty)
+    summary['unchanged'] = len(matched) - len(dirty)
+    return summary
@@ -0,0 +1,86 @@
+"""
+간단한 in-process 성능 지표 registry.
+- counter / histogram 을 label 별로 누적하고 Prometheus text format 으로 출력 (/metrics)
+- 값은 worker 프로세스별로 따로 쌓인다. (run_upload_jobs 등 별도 프로세스 값은 포함되지 않음)
+"""
+import threading
+from collections import defaultdict
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30)
+
+HELP = {
+    'dlc_requests_total': ('counter', 'Requests by view and status code.'),
+    'dlc_request_duration_seconds': ('histogram', 'Request latency by view.'),
+    'dlc_db_queries_total': ('counter', 'Database queries by view.'),
+    'dlc_db_query_seconds_total': ('counter', 'Time spent in database queries by view.'),
+    'dlc_slow_requests_total': ('counter', 'Requests over PERF_SLOW_REQUEST_MS by view.'),
+    'dlc_rows_ingested_total': ('counter', 'Rows read from uploaded files by upload kind.'),
+    'dlc_rows_exported_total': ('counter', 'Rows written to downloaded files by export kind.'),
+    'dlc_cache_requests_total': ('counter', 'Page cache lookups by namespace and hit/miss.'),
+    'dlc_export_snapshots_total': ('counter', 'Admin export requests by format and built/reused snapshot.'),
+}
+
+
+def _labels(labels):
+    return tuple(sorted(labels.items()))
+
+
+def _fmt_labels(labels, extra=()):
+    items = list(labels) + list(extra)
+    if not items:
+        return ''
+    body = ','.join('%s="%s"' % (k, str(v).replace('\\', '\\\\').replace('"', '\\"')) for k, v in items)
+    return '{' + body + '}'
+
+
+class Registry:
+    def __init__(self, buckets=LATENCY_BUCKETS):
+        self.buckets = buckets
+        self._lock = threading.Lock()
+        self._counters = defaultdict(float)
+        self._histograms = {}
+
+    def inc(self, name, value=1, **labels):
+        with self._lock:
+            self._counters[(name, _labels(labels))] += value
+
+    def observe(self, name, value, **labels):
+        key = (name, _labels(labels))
+        with self._lock:
+            hist = self._histograms.get(key)
+            if hist is None:
+                hist = self._histograms[key] = [[0] * len(self.buckets), 0.0, 0]
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    hist[0][i] += 1
+            hist[1] += value
+            hist[2] += 1
+
+    def render(self):
+        """Prometheus text exposition format."""
+        with self._lock:
+            counters = sorted(self._counters.items())
+            histograms = sorted((k, [list(v[0]), v[1], v[2]]) for k, v in self._histograms.items())
+        lines, described = [], set()
+
+        def describe(name):
+            if name not in described and name in HELP:
+                kind, text = HELP[name]
+                lines.append(f'# HELP {name} {text}')
+                lines.append(f'# TYPE {name} {kind}')
+            described.add(name)
+
+        for (name, labels), value in counters:
+            describe(name)
+            lines.append(f'{name}{_fmt_labels(labels)} {value:g}')
+        for (name, labels), (counts, total, count) in histograms:
+            describe(name)
+            for bound, n in zip(self.buckets, counts):
+                lines.append(f'{name}_bucket{_fmt_labels(labels, [("le", f"{bound:g}")])} {n}')
+            lines.append(f'{name}_bucket{_fmt_labels(labels, [("le", "+Inf")])} {count}')
+            lines.append(f'{name}_sum{_fmt_labels(labels)} {total:g}')
+            lines.append(f'{name}_count{_fmt_labels(labels)} {count}')
+        return '\n'.join(lines) + '\n'
+
+
+registry = Registry()
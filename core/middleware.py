@@ -0,0 +1,56 @@
+import logging
+import time
+
+from django.conf import settings
+from django.db import connection
+
+from .metrics import registry
+
+logger = logging.getLogger('core.perf')
+
+
+class _QueryStats:
+    """connection.execute_wrapper: 요청 중 실행된 쿼리 수와 시간 누적."""
+
+    def __init__(self):
+        self.count = 0
+        self.seconds = 0.0
+
+    def __call__(self, execute, sql, params, many, context):
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.count += 1
+            self.seconds += time.perf_counter() - start
+
+
+class PerformanceMiddleware:
+    """
+    view 별 응답 시간, DB 쿼리 수/시간을 metrics registry 에 기록.
+    응답 시간이 PERF_SLOW_REQUEST_MS 를 넘으면 warning 로그.
+    (StreamingHttpResponse 는 응답 객체를 만들 때까지만 측정)
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.budget = getattr(settings, 'PERF_SLOW_REQUEST_MS', 2000) / 1000
+
+    def __call__(self, request):
+        stats = _QueryStats()
+        start = time.perf_counter()
+        with connection.execute_wrapper(stats):
+            response = self.get_response(request)
+        elapsed = time.perf_counter() - start
+
+        match = getattr(request, 'resolver_match', None)
+        view = match.view_name if match else 'unresolved'
+        registry.inc('dlc_requests_total', view=view, status=response.status_code)
+        registry.observe('dlc_request_duration_seconds', elapsed, view=view)
+        registry.inc('dlc_db_queries_total', stats.count, view=view)
+        registry.inc('dlc_db_query_seconds_total', stats.seconds, view=view)
+        if elapsed > self.budget:
+            registry.inc('dlc_slow_requests_total', view=view)
+            logger.warning('slow request: %s %s (%s) %.0f ms, %d queries (%.0f ms)',
+                           request.method, request.path, view, elapsed * 1000, stats.count, stats.seconds * 1000)
+        return response
@@ -1,15 +1,52 @@
 from django.db import models
 
-class Faculty(models.Model):
+from .normalize import SEMESTERS, search_key, term_semester, term_year
+
+
+class SearchKeyMixin:
+    """korean_key / english_key: 정확 일치 검색용 정규화 이름 (normalize.search_key)."""
+
+    def set_search_keys(self):
+        self.korean_key = search_key(self.korean_name)
+        self.english_key = search_key(self.english_name)
+
+    def save(self, *args, **kwargs):
+        self.set_search_keys()
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None and {'korean_name', 'english_name'} & set(update_fields):
+            kwargs['update_fields'] = set(update_fields) | {'korean_key', 'english_key'}
+        super().save(*args, **kwargs)
+
+
+class TermMixin:
+    """term_year / term_semester: Year / Semester 문자열을 정규화한 학기 (현재 학기 검색, 보관용)."""
+
+    def set_term(self):
+        self.term_year = term_year(self.year)
+        self.term_semester = term_semester(self.semester)
+
+    def save(self, *args, **kwargs):
+        self.set_term()
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None and {'year', 'semester'} & set(update_fields):
+            kwargs['update_fields'] = set(update_fields) | {'term_year', 'term_semester'}
+        super().save(*args, **kwargs)
+
+
+class Faculty(SearchKeyMixin, models.Model):
     korean_name = models.CharField(max_length=200, unique=True)
     english_name = models.CharField(max_length=200, blank=True)
     category = models.CharField(max_length=100, blank=True)
     email = models.EmailField(blank=True)
+    korean_key = models.CharField(max_length=200, blank=True, db_index=True, editable=False)
+    english_key = models.CharField(max_length=200, blank=True, db_index=True, editable=False)
 
     def __str__(self):
         return self.korean_name
 
-class CourseModality(models.Model):
+class CourseModalityBase(models.Model):
+    """CourseModality / CourseModalityArchive 공통 필드."""
+    archived = False  # 검색 결과 템플릿: 보관된 레코드는 신청/조회 링크를 만들지 않음
     korean_name = models.CharField(max_length=200)
     name = models.CharField(max_length=200, blank=True)
     english_name = models.CharField(max_length=200, blank=True)
@@ -26,12 +63,89 @@ class CourseModality(models.Model):
     reason_for_applying = models.TextField(blank=True)
     modified_date = models.DateTimeField(null=True, blank=True)
     password = models.CharField(max_length=10, blank=True)
+    korean_key = models.CharField(max_length=200, blank=True, db_index=True, editable=False)
+    english_key = models.CharField(max_length=200, blank=True, db_index=True, editable=False)
+    term_year = models.PositiveSmallIntegerField(null=True, blank=True, editable=False)
+    term_semester = models.PositiveSmallIntegerField(null=True, blank=True, choices=list(SEMESTERS.items()), editable=False)
+
+    class Meta:
+        abstract = True
+
+
+class CourseModality(SearchKeyMixin, TermMixin, CourseModalityBase):
 
     class Meta:
         indexes = [
             models.Index(fields=['korean_name']),
             models.Index(fields=['english_name']),
+            # 현재 학기 검색 / export, admin list_filter (Year / Semester / Apply) 용
+            models.Index(fields=['term_year', 'term_semester']),
+            models.Index(fields=['term_semester']),
+            # SQLite 에서 Boolean 조건은 'WHERE apply_this_semester' / 'WHERE NOT ...' 로 만들어지므로 부분(partial) 인덱스로
+            models.Index(fields=['term_year', 'term_semester'], condition=models.Q(apply_this_semester=True), name='course_applied_idx'),
+            models.Index(fields=['term_year', 'term_semester'], condition=models.Q(apply_this_semester=False), name='course_not_applied_idx'),
         ]
 
     def __str__(self):
         return f"{self.korean_name} ({self.id})"
+
+
+class CourseModalityArchive(CourseModalityBase):
+    """지난 학기 CourseModality (manage.py archive_courses 가 옮김). 검색/export 에서 scope='archive' 로 조회."""
+    archived = True
+    original_id = models.IntegerField(db_index=True)
+    archived_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['term_year', 'term_semester'], name='course_archive_term_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.korean_name} ({self.original_id}, archived)"
+
+class UploadJob(models.Model):
+    """백그라운드로 처리할 엑셀 업로드 작업 (manage.py run_upload_jobs 가 처리)."""
+    KIND_CHOICES = [('faculty', 'Faculty'), ('course', 'Course Modality')]
+    STATUS_CHOICES = [('pending', 'Pending'), ('running', 'Running'), ('done', 'Done'), ('failed', 'Failed')]
+
+    kind = models.CharField(max_length=20, choices=KIND_CHOICES)
+    file = models.FileField(upload_to='uploads/%Y/%m/')
+    original_name = models.CharField(max_length=255, blank=True)
+    status = models.CharField(max_length=20, choices=STATUS_CHOICES, default='pending', db_index=True)
+    total_rows = models.IntegerField(null=True, blank=True)
+    rows_processed = models.IntegerField(default=0)
+    summary = models.JSONField(default=dict, blank=True)
+    force = models.BooleanField(default=False)
+    error = models.TextField(blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    started_at = models.DateTimeField(null=True, blank=True)
+    finished_at = models.DateTimeField(null=True, blank=True)
+
+    def __str__(self):
+        return f"{self.kind} upload #{self.id} ({self.status})"
+
+
+class UploadFingerprint(models.Model):
+    """종류(kind)별 마지막으로 처리한 업로드 파일의 sha256 (같은 파일 재업로드 거부)."""
+    kind = models.CharField(max_length=20, unique=True)
+    sha256 = models.CharField(max_length=64)
+    rows = models.IntegerField(default=0)
+    uploaded_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return f"{self.kind} {self.sha256[:12]}"
+
+class RowFingerprint(models.Model):
+    """종류(kind)별 Korean_name 행(들)의 정규화된 값 hash (바뀌지 않은 행은 병합 생략)."""
+    kind = models.CharField(max_length=20)
+    korean_name = models.CharField(max_length=200)
+    digest = models.CharField(max_length=40)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=['kind', 'korean_name'], name='unique_row_fingerprint'),
+        ]
+
+    def __str__(self):
+        return f"{self.kind} {self.korean_name}"
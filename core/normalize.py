@@ -0,0 +1,101 @@
+"""
+값 정규화 helper (pandas 없이 동작 -> 폼 처리 등 가벼운 요청 경로에서도 사용).
+- search_key: 검색 키. Unicode NFC (자모 분리형 한글도 같은 키), 대소문자 무시(casefold), 연속 공백 정리
+- norm_cell / parse_bool_cell: 엑셀 셀 값 정규화 (업로드 파싱과 같은 규칙)
+- term_year / term_semester: 자유 입력 Year / Semester 문자열 -> 학기 정렬용 숫자 (예: '2025', 'Fall' -> 2025, 3)
+"""
+import math
+import re
+import unicodedata
+
+# pandas.isna 가 결측으로 보는 pandas 전용 값 (pd.NA, pd.NaT) 의 타입 이름
+_PANDAS_MISSING = ('NAType', 'NaTType')
+
+
+def search_key(value):
+    """정확 일치 검색용 키. 예: '  Kim   MIN-su ' -> 'kim min-su'"""
+    if not value:
+        return ''
+    return unicodedata.normalize('NFC', ' '.join(unicodedata.normalize('NFC', str(value)).casefold().split()))
+
+
+def _is_missing(value):
+    if value is None:
+        return True
+    if isinstance(value, float):
+        return math.isnan(value)
+    if type(value).__name__ in _PANDAS_MISSING:
+        return True
+    # numpy 스칼라(np.float32 NaN, np.datetime64('NaT') 등): 자기 자신과 같지 않으면 결측
+    return type(value).__module__ == 'numpy' and getattr(value, 'ndim', None) == 0 and value != value
+
+
+def norm_cell(value):
+    """
+    엑셀 셀 값(normalize).
+    - NaN / None -> ''
+    - 숫자(예: 1205.0) -> '1205' (정수이면 소수점 제거)
+    - 문자열 -> strip() 된 문자열 반환
+    """
+    if _is_missing(value):
+        return ''
+    if isinstance(value, (int,)):
+        return str(value)
+    if isinstance(value, float):
+        if value.is_integer():
+            return str(int(value))
+        else:
+            return str(value)
+    return str(value).strip()
+
+
+def parse_bool_cell(value):
+    """Convert cell value to boolean if possible. Returns None if unknown/empty."""
+    v = norm_cell(value)
+    if v == '':
+        return None
+    vl = v.strip().lower()
+    if vl in ('yes', 'y', 'true', '1', 'apply'):
+        return True
+    if vl in ('no', 'n', 'false', '0'):
+        return False
+    return None
+
+
+# 학기 번호 (같은 해 안에서의 순서). 숫자 학기 '1' / '2' 는 1학기(봄), 2학기(가을)
+SEMESTERS = {1: 'Spring', 2: 'Summer', 3: 'Fall', 4: 'Winter'}
+_SEMESTER_ALIASES = {
+    'spring': 1, 'spr': 1, 'sp': 1, '1': 1, '1st': 1, '1학기': 1, '봄': 1, '봄학기': 1,
+    'summer': 2, 'sum': 2, 'su': 2, '여름': 2, '여름학기': 2,
+    'fall': 3, 'autumn': 3, 'fa': 3, '2': 3, '2nd': 3, '2학기': 3, '가을': 3, '가을학기': 3,
+    'winter': 4, 'win': 4, 'wi': 4, '겨울': 4, '겨울학기': 4,
+}
+_YEAR = re.compile(r'(?<!\d)((?:19|20)\d{2})(?!\d)')
+_TERM_SEPARATORS = re.compile(r'[\s\-_/.,()]+')
+
+
+def term_year(value):
+    """Year 값에서 네 자리 연도 (예: 2025.0, '2025년', 'AY2025' -> 2025). 없으면 None."""
+    match = _YEAR.search(norm_cell(value))
+    return int(match.group(1)) if match else None
+
+
+def term_semester(value):
+    """Semester 값의 학기 번호 (SEMESTERS). 예: 'Fall', '2', '2학기', '2025-2' -> 3. 알 수 없으면 None."""
+    text = search_key(_YEAR.sub(' ', norm_cell(value)))
+    if text.replace(' ', '') in _SEMESTER_ALIASES:
+        return _SEMESTER_ALIASES[text.replace(' ', '')]
+    for token in _TERM_SEPARATORS.split(text):
+        if token in _SEMESTER_ALIASES:
+            return _SEMESTER_ALIASES[token]
+    return None
+
+
+def parse_term(value):
+    """'2025 Fall', '2025-2', 'Fall 2025' -> (2025, 3). 알 수 없는 부분은 None."""
+    return term_year(value), term_semester(value)
+
+
+def format_term(year, semester):
+    """(2025, 3) -> '2025 Fall' (학기를 모르면 '2025')."""
+    return f'{year} {SEMESTERS[semester]}' if semester else f'{year}'
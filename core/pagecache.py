@@ -0,0 +1,77 @@
+"""
+검색 결과 / 공개 레코드 정보 캐시 (Django cache framework 'pages' 캐시).
+- 키에 데이터 버전(versioning)을 넣으므로 업로드, 신청/취소, admin 수정 후에는 자동으로 새 키를 사용
+  (이전 버전 값은 TTL / MAX_ENTRIES 에 따라 자연히 밀려남)
+- 비밀번호를 확인한 뒤에만 보여주는 내용(신청 사유, 비밀번호 등)은 캐시하지 않는다.
+- admin changelist 의 COUNT(*) 도 같은 방식으로 (데이터 버전, 쿼리)별 캐시 (VersionedCountPaginator)
+"""
+import hashlib
+
+from django.core.cache import caches
+from django.core.exceptions import EmptyResultSet
+from django.core.paginator import Paginator
+from django.http import Http404
+from django.utils.functional import cached_property
+
+from .metrics import registry
+from .models import CourseModality
+from .versioning import get_data_version
+
+PAGE_CACHE = 'pages'
+
+# course_apply / course_lookup GET 화면에 필요한 공개 필드 (password, reason_for_applying 제외)
+PUBLIC_RECORD_FIELDS = ['id', 'korean_name', 'name', 'english_name', 'year', 'semester', 'course_title']
+
+_MISSING = 'missing'
+
+
+def cache_key(namespace, *parts):
+    """'dlc:<namespace>:<데이터 버전>:<parts hash>'"""
+    digest = hashlib.sha1('\x1f'.join(map(str, parts)).encode()).hexdigest()
+    return f'dlc:{namespace}:{get_data_version()}:{digest}'
+
+
+def get_or_build(namespace, parts, build):
+    """캐시에 있으면 그 값을, 없으면 build() 결과를 저장하고 반환."""
+    store = caches[PAGE_CACHE]
+    key = cache_key(namespace, *parts)
+    value = store.get(key)
+    if value is None:
+        registry.inc('dlc_cache_requests_total', namespace=namespace, result='miss')
+        value = build()
+        store.set(key, value)
+    else:
+        registry.inc('dlc_cache_requests_total', namespace=namespace, result='hit')
+    return value
+
+
+def public_record(pk):
+    """CourseModality 의 공개 필드 dict (캐시). 없으면 Http404."""
+    def build():
+        rec = CourseModality.objects.filter(pk=pk).values(*PUBLIC_RECORD_FIELDS).first()
+        return rec or _MISSING
+
+    rec = get_or_build('course_record', (pk,), build)
+    if rec == _MISSING:
+        raise Http404('No CourseModality matches the given query.')
+    return rec
+
+
+class VersionedCountPaginator(Paginator):
+    """
+    전체 건수(count)를 데이터 버전 + 쿼리(SQL) 별로 캐시하는 Paginator.
+    같은 검색/필터로 페이지를 넘길 때는 COUNT(*) 를 다시 실행하지 않고,
+    데이터가 바뀌면(버전 변경) 다음 요청에서 한 번만 다시 센다.
+    """
+
+    @cached_property
+    def count(self):
+        query = getattr(self.object_list, 'query', None)
+        if query is None:
+            return super().count
+        try:
+            sql, params = query.sql_with_params()
+        except EmptyResultSet:
+            return 0
+        return get_or_build('admin_count', (query.model._meta.label_lower, sql, params),
+                            lambda: Paginator.count.func(self))
@@ -0,0 +1,79 @@
+"""
+이름 목록 일괄 fuzzy 매칭 (batch resolver).
+- 붙여넣은/업로드한 이름들을 Faculty 또는 CourseModality 의 국문/영문 이름 전체와 한 번에 비교
+- 비교는 검색 키(search_key) 기준 + 단어 순서 무시(token_sort_ratio): 'Minsu Kim' == 'kim minsu'
+- 이름마다 점수 상위 limit 개와 해당 레코드 정보를 반환 (password / 신청 사유는 포함하지 않음)
+- course 는 scope(기본: 현재 학기, core/terms.py) 범위의 레코드만 후보
+"""
+from rapidfuzz import fuzz
+
+from .fuzzy import top_matches
+from .models import CourseModality, Faculty
+from .normalize import search_key
+from .terms import archive_row, record_fields, scoped_courses
+
+# target -> (모델, 출력 필드)
+RESOLVE_TARGETS = {
+    'faculty': (Faculty, ['korean_name', 'english_name', 'category', 'email']),
+    'course': (CourseModality, ['id', 'korean_name', 'english_name', 'year', 'semester', 'course_title']),
+}
+RESOLVE_HEADERS = ['Query', 'Rank', 'Match', 'Score']
+
+
+def _choices(queryset, fields, scope=None):
+    """{검색 키: [레코드 dict, ...]} — 국문/영문 이름 모두 후보. scope 를 주면 'archived' 표시 (course)."""
+    records = {}
+    for rec in queryset.order_by('id').values(*set(fields) | {'id', 'korean_name', 'english_name'}):
+        row = {f: rec[f] for f in fields}
+        if scope is not None:
+            archive_row(row, scope)
+        for name in (rec['korean_name'], rec['english_name']):
+            key = search_key(name)
+            if key and row not in records.setdefault(key, []):
+                records[key].append(row)
+    return records
+
+
+def resolve_names(names, target='faculty', limit=3, score_cutoff=70, scope='current'):
+    """
+    names 각각에 대해 [{'query', 'matches': [{'name', 'score', 'records': [...]}, ...]}, ...] 반환.
+    같은 이름이 여러 번 있어도 점수 계산은 한 번만 한다. scope 는 target='course' 일 때만 사용.
+    """
+    model, fields = RESOLVE_TARGETS[target]
+    if model is CourseModality:
+        records = _choices(scoped_courses(scope), record_fields(fields, scope), scope)
+    else:
+        records = _choices(model.objects.all(), fields)
+    keys = list(dict.fromkeys(k for k in map(search_key, names) if k))
+    matches = dict(zip(keys, top_matches(keys, list(records), limit=limit, score_cutoff=score_cutoff,
+                                         scorer=fuzz.token_sort_ratio)))
+    return [
+        {
+            'query': name,
+            'matches': [
+                {'name': key, 'score': round(score, 1), 'records': records[key]}
+                for key, score in matches.get(search_key(name), [])
+            ],
+        }
+        for name in names
+    ]
+
+
+def resolve_rows(results, target='faculty', scope='current'):
+    """
+    resolve_names() 결과를 엑셀 행으로: (헤더, 행 iterator). 레코드마다 한 행, 매칭이 없으면 빈 행.
+    course 의 scope='archive' 는 original_id(원래 레코드 번호) 컬럼 추가.
+    """
+    model, fields = RESOLVE_TARGETS[target]
+    if model is CourseModality:
+        fields = record_fields(fields, scope)
+
+    def rows():
+        for item in results:
+            if not item['matches']:
+                yield [item['query'], '', '', ''] + [''] * len(fields)
+            for rank, match in enumerate(item['matches'], 1):
+                for rec in match['records']:
+                    yield [item['query'], rank, match['name'], match['score']] + [rec[f] for f in fields]
+
+    return RESOLVE_HEADERS + fields, rows()
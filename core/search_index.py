@@ -0,0 +1,152 @@
+"""
+fuzzy 검색용 in-process 이름 인덱스.
+- 모델별로 한 번 만들어 두고, 데이터 버전(versioning)이 바뀌었을 때만 다시 만든다.
+- CourseModality 는 학기 범위(scope, core/terms.py)별 인덱스: 기본은 현재 학기 레코드만
+- 이름은 중복 제거, 이름 -> 레코드 id 목록 매핑
+- 문자 역색인으로 후보를 먼저 추리고, fuzz.ratio 는 후보에만 계산한다.
+  fuzz.ratio(a, b) <= 200 * (공통 문자 수) / (len(a) + len(b)) 이므로
+  이 상한이 SCORE_CUTOFF 미만인 이름은 계산하지 않아도 결과가 같다.
+"""
+import bisect
+import threading
+from collections import Counter, defaultdict
+
+import numpy as np
+from rapidfuzz import fuzz, process
+
+from .models import CourseModality, CourseModalityArchive, Faculty
+from .normalize import search_key
+from .terms import scoped_courses
+from .versioning import get_data_version
+
+SCORE_CUTOFF = 70
+
+# 모델별 fuzzy 검색 대상 필드
+INDEX_FIELDS = {
+    Faculty: ('korean_name',),
+    CourseModality: ('korean_name', 'english_name'),
+}
+
+
+def _char_keys(text):
+    """문자별 (문자, n번째 등장) 키. 두 이름의 공통 키 수 = 공통 문자 수(중복 포함)."""
+    seen = Counter()
+    keys = []
+    for ch in text:
+        seen[ch] += 1
+        keys.append((ch, seen[ch]))
+    return keys
+
+
+class NameIndex:
+    """이름 목록 + 문자 역색인. rows: (id, 이름1, 이름2, ...) 튜플들."""
+
+    def __init__(self, rows):
+        self.names = []
+        self.ids = defaultdict(list)
+        postings = defaultdict(list)
+        rows = list(rows)
+        # 필드별로(korean_name 전체 -> english_name 전체), 이름 순서대로 등록
+        # (기존 values_list 전체 검색이 인덱스 순서로 읽던 것과 같은 순서 -> 동점 처리 동일)
+        width = len(rows[0]) if rows else 0
+        for col in range(1, width):
+            for row in sorted(rows, key=lambda r: (r[col], r[0])):
+                pk, name = row[0], row[col]
+                if not name:
+                    continue
+                if name not in self.ids:
+                    pos = len(self.names)
+                    self.names.append(name)
+                    for key in _char_keys(name):
+                        postings[key].append(pos)
+                if pk not in self.ids[name]:
+                    self.ids[name].append(pk)
+        self.postings = {key: np.array(pos, dtype=np.int32) for key, pos in postings.items()}
+        self.lengths = np.array([len(n) for n in self.names], dtype=np.int32)
+
+    def _candidates(self, query, score_cutoff):
+        common = np.zeros(len(self.names), dtype=np.int32)
+        for key in _char_keys(query):
+            pos = self.postings.get(key)
+            if pos is not None:
+                common[pos] += 1
+        bound = 200 * common >= score_cutoff * (self.lengths + len(query))
+        # 원래 목록 순서를 유지해야 동점일 때 전체 검색과 같은 결과가 나온다
+        return [self.names[pos] for pos in np.flatnonzero(bound & (common > 0))]
+
+    def lookup(self, query, score_cutoff=SCORE_CUTOFF):
+        """가장 비슷한 이름의 (name, score, [id, ...]) 반환. 없으면 None."""
+        if not query or not self.names:
+            return None
+        candidates = self._candidates(query, score_cutoff)
+        if not candidates:
+            return None
+        match = process.extractOne(query, candidates, scorer=fuzz.ratio, score_cutoff=score_cutoff)
+        if not match:
+            return None
+        return match[0], match[1], self.ids[match[0]]
+
+
+class PrefixIndex:
+    """
+    (정규화된 이름, id) 정렬 목록. 접두어로 시작하는 이름을 bisect 로 찾는다.
+    키는 정확 일치 검색 / admin 검색과 같은 search_key (NFC + 공백 정리 + 대소문자 무시).
+    """
+
+    def __init__(self, rows):
+        entries = sorted({(search_key(name), row[0]) for row in rows for name in row[1:] if name})
+        self.keys = [k for k, _ in entries]
+        self.pks = [pk for _, pk in entries]
+
+    def search(self, prefix):
+        """prefix 로 시작하는 이름의 레코드 id 목록 (이름 순, 중복 제거)."""
+        key = search_key(prefix)
+        if not key:
+            return []
+        lo = bisect.bisect_left(self.keys, key)
+        hi = bisect.bisect_left(self.keys, key + '\U0010ffff', lo)
+        return list(dict.fromkeys(self.pks[lo:hi]))
+
+
+PREFIX_FIELDS = {
+    Faculty: ('korean_name', 'english_name'),
+    CourseModality: ('korean_name', 'english_name'),
+}
+
+_indexes = {}
+_lock = threading.Lock()
+
+
+def _queryset(model, scope):
+    """인덱스를 만들 레코드: CourseModality 는 scope 범위(archive 이면 CourseModalityArchive), 그 외 전체."""
+    if model is CourseModality:
+        return scoped_courses(scope)
+    return model.objects.all()
+
+
+def _get_index(cls, model, fields, scope):
+    """cls(rows) 인덱스를 (model, scope) 별로 memoize (데이터 버전이 바뀌었으면 다시 생성)."""
+    if model is not CourseModality:
+        scope = None
+    key = (cls, model, scope)
+    version = get_data_version(CourseModalityArchive if scope == 'archive' else model)
+    cached = _indexes.get(key)
+    if cached and cached[0] == version:
+        return cached[1]
+    with _lock:
+        cached = _indexes.get(key)
+        if cached and cached[0] == version:
+            return cached[1]
+        index = cls(_queryset(model, scope).values_list('id', *fields))
+        _indexes[key] = (version, index)
+        return index
+
+
+def get_name_index(model, scope='current'):
+    """model 의 fuzzy 검색용 NameIndex (CourseModality 는 scope 범위, 레코드 id 는 scope 의 모델 기준)."""
+    return _get_index(NameIndex, model, INDEX_FIELDS[model], scope)
+
+
+def get_prefix_index(model, scope='current'):
+    """model 의 자동완성용 PrefixIndex (korean_name, english_name)."""
+    return _get_index(PrefixIndex, model, PREFIX_FIELDS[model], scope)
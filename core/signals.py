@@ -0,0 +1,94 @@
+"""
+모델 저장/삭제 시 데이터 버전 갱신.
+(bulk_create / bulk_update / update() 는 signal 이 없으므로 호출하는 쪽에서 직접 bump,
+ admin 일괄 삭제는 incremental.delete_records 가 한 번에 처리)
+레코드가 업로드 밖에서 바뀌면 증분 업로드 hash 를 지워서 다음 업로드 때 다시 병합되게 한다.
+migrate 후에는 검색 키(korean_key / english_key)와 학기(term_year / term_semester)가 비어 있는 기존 레코드를 채운다.
+"""
+from django.db.models.signals import post_delete, post_migrate, post_save
+from django.dispatch import receiver
+
+from .incremental import MODEL_KINDS, forget
+from .models import CourseModality, CourseModalityArchive, Faculty
+from .versioning import bump_data_version
+
+
+@receiver(post_save, sender=Faculty)
+@receiver(post_delete, sender=Faculty)
+@receiver(post_save, sender=CourseModality)
+@receiver(post_delete, sender=CourseModality)
+@receiver(post_save, sender=CourseModalityArchive)
+@receiver(post_delete, sender=CourseModalityArchive)
+def _bump_on_change(sender, **kwargs):
+    bump_data_version(sender)
+
+
+@receiver(post_save, sender=Faculty)
+@receiver(post_save, sender=CourseModality)
+def _forget_saved(sender, instance, update_fields=None, **kwargs):
+    # update_fields 로 이름을 바꾸지 않은 저장(신청/취소 등)은 그 이름만, 그 외(관리자 수정 등)는 전체
+    if update_fields is not None and 'korean_name' not in update_fields:
+        forget(MODEL_KINDS[sender], [instance.korean_name])
+    else:
+        forget(MODEL_KINDS[sender])
+
+
+@receiver(post_delete, sender=Faculty)
+@receiver(post_delete, sender=CourseModality)
+def _forget_deleted(sender, instance, **kwargs):
+    forget(MODEL_KINDS[sender], [instance.korean_name])
+
+
+def backfill_search_keys(models=(Faculty, CourseModality)):
+    """korean_key 가 비어 있는 레코드의 검색 키를 채우고, 채운 건수를 반환."""
+    from .db import BATCH_SIZE, _bulk_update
+
+    total = 0
+    for model in models:
+        stale = model.objects.filter(korean_key='').exclude(korean_name='').only('id', 'korean_name', 'english_name')
+        batch = []
+        for obj in stale.iterator(chunk_size=BATCH_SIZE):
+            obj.set_search_keys()
+            batch.append(obj)
+            if len(batch) >= BATCH_SIZE:
+                _bulk_update(model, batch, ['korean_key', 'english_key'])
+                total += len(batch)
+                batch = []
+        if batch:
+            _bulk_update(model, batch, ['korean_key', 'english_key'])
+            total += len(batch)
+    return total
+
+
+def backfill_terms():
+    """Year / Semester 값은 있는데 학기(term_year / term_semester)가 비어 있는 CourseModality 를 채우고, 채운 건수를 반환."""
+    from django.db.models import Q
+
+    from .db import BATCH_SIZE, _bulk_update
+
+    stale = (CourseModality.objects.filter(Q(term_year=None) & ~Q(year='') | Q(term_semester=None) & ~Q(semester=''))
+             .only('id', 'year', 'semester', 'term_year', 'term_semester'))
+    total = 0
+    batch = []
+    for obj in stale.iterator(chunk_size=BATCH_SIZE):
+        before = (obj.term_year, obj.term_semester)
+        obj.set_term()
+        if (obj.term_year, obj.term_semester) != before:  # 알아볼 수 없는 값은 그대로 (None)
+            batch.append(obj)
+        if len(batch) >= BATCH_SIZE:
+            _bulk_update(CourseModality, batch, ['term_year', 'term_semester'])
+            total += len(batch)
+            batch = []
+    if batch:
+        _bulk_update(CourseModality, batch, ['term_year', 'term_semester'])
+        total += len(batch)
+    if total:
+        bump_data_version(CourseModality)  # 현재 학기를 다시 계산하도록
+    return total
+
+
+@receiver(post_migrate)
+def _backfill_after_migrate(sender, **kwargs):
+    if sender.name == 'core':
+        backfill_search_keys()
+        backfill_terms()
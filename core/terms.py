@@ -0,0 +1,89 @@
+"""
+학기(term) 범위.
+- 현재 학기(active term): settings.ACTIVE_TERM (예: '2025 Fall'), 없으면 DB 에 있는 가장 최근 학기
+- 검색 / 일괄 조회 / export / fuzzy 이름 인덱스는 기본으로 현재 학기만 본다
+  (학기를 알 수 없는 레코드 — term_year 가 없거나, 같은 해인데 학기를 모르는 레코드 — 도 포함)
+- scope: 'current' (현재 학기, 기본) | 'all' (CourseModality 전체) | 'archive' (보관된 지난 학기, CourseModalityArchive)
+"""
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+from django.db.models import Q
+
+from .models import CourseModality, CourseModalityArchive
+from .normalize import format_term, parse_term
+from .versioning import get_data_version
+
+SCOPE_CHOICES = [
+    ('current', 'Current semester'),
+    ('all', 'All semesters'),
+    ('archive', 'Archived semesters'),
+]
+SCOPES = [value for value, _ in SCOPE_CHOICES]
+
+_latest = (None, None)  # (데이터 버전, 학기): 여러 스레드가 읽으므로 tuple 하나를 통째로 바꾼다
+
+
+def _latest_term():
+    """DB 의 가장 최근 (term_year, term_semester). 데이터 버전별로 한 번만 조회 ((term_year, term_semester) 인덱스 역순)."""
+    global _latest
+    version = get_data_version(CourseModality)
+    cached_version, term = _latest
+    if cached_version != version:
+        term = (CourseModality.objects.filter(term_year__isnull=False, term_semester__isnull=False)
+                .order_by('-term_year', '-term_semester').values_list('term_year', 'term_semester').first())
+        _latest = (version, term)
+    return term
+
+
+def active_term():
+    """현재 학기 (term_year, term_semester). 학기 정보가 있는 레코드가 하나도 없으면 None."""
+    configured = getattr(settings, 'ACTIVE_TERM', None)
+    if not configured:
+        return _latest_term()
+    term = parse_term(configured)
+    if None in term:
+        raise ImproperlyConfigured(f'ACTIVE_TERM {configured!r} 에서 연도와 학기를 알 수 없습니다 (예: "2025 Fall").')
+    return term
+
+
+def active_term_label():
+    term = active_term()
+    return format_term(*term) if term else ''
+
+
+def term_q(term):
+    """term 학기 + 학기를 알 수 없는 레코드 조건 (term 이 None 이면 전체)."""
+    if term is None:
+        return Q()
+    year, semester = term
+    return Q(term_year=year, term_semester=semester) | Q(term_year=None) | Q(term_year=year, term_semester=None)
+
+
+def closed_terms_q(before):
+    """before 학기보다 이전 학기 조건 (연도만 아는 레코드는 이전 연도일 때만)."""
+    year, semester = before
+    return Q(term_year__lt=year) | Q(term_year=year, term_semester__lt=semester)
+
+
+def record_fields(fields, scope):
+    """
+    values() 로 읽을 필드. scope='archive' 의 'id' 는 보관 테이블의 id 이므로 원래 레코드 번호(original_id)도 읽는다.
+    (레코드 dict 에는 archive_row 로 'archived' 표시)
+    """
+    return [*fields, 'original_id'] if scope == 'archive' else list(fields)
+
+
+def archive_row(row, scope):
+    """레코드 dict 에 'archived' 표시 (True 이면 신청/조회 링크 대상이 아님)."""
+    row['archived'] = scope == 'archive'
+    return row
+
+
+def scoped_courses(scope='current'):
+    """scope 에 해당하는 queryset (archive: CourseModalityArchive, 그 외: CourseModality)."""
+    if scope == 'archive':
+        return CourseModalityArchive.objects.all()
+    queryset = CourseModality.objects.all()
+    if scope == 'all':
+        return queryset
+    return queryset.filter(term_q(active_term()))
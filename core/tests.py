@@ -0,0 +1,162 @@
+"""
+벤치마크 시나리오(core/benchmarks.py)를 작은 규모로 실행하는 회귀 테스트: python manage.py test core
+- 업로드 결과(신규 / 변경 / 변경 없음 건수), export 헤더, 학기별 병합 / 보관
+- 시나리오별 쿼리 수 상한 (청크 / bulk 처리가 행 단위 쿼리로 돌아가면 실패)
+"""
+import csv
+import io
+import shutil
+import tempfile
+
+from django.db import connection
+from django.test import Client, TestCase, override_settings
+
+from core.archive import archive_courses
+from core.benchmarks import (
+    COURSE_HEADERS, EDITS, SCENARIOS, Dataset, _export, _reset, _upload, _xlsx, compare, measure_startup,
+    run_benchmarks,
+)
+from core.export import EXPORT_HEADERS, export_queryset
+from core.middleware import _QueryStats
+from core.models import CourseModality, CourseModalityArchive, Faculty
+from core.views import ADMIN_PIN
+
+ROWS = 200
+
+# 시나리오별 쿼리 수 상한 (ROWS 행 기준, 대부분 행 수와 무관해야 한다)
+QUERY_CEILINGS = {
+    'faculty_upload': 20,
+    'faculty_upload_repeat': 1,
+    'course_upload': 24,
+    'course_upload_repeat': 1,
+    'course_upload_edited': 20,
+    'course_upload_force': 16,
+    'faculty_enrich_upload': 4,
+    'faculty_search_miss': 70,
+    'course_search_miss': 80,
+    'course_admin_export': 8,
+    'course_admin_export_csv': 8,
+    'course_admin_export_snapshot': 5,
+    'course_admin_changelist': 320,
+    'course_admin_bulk_apply': 26,
+    'course_admin_export_selection': 7,
+    'course_search_miss_all_terms': 100,
+    'course_archive': 20,
+}
+
+# 'versions' 캐시(FileBasedCache)와 export 스냅샷을 개발용 파일과 섞지 않는다
+TEST_CACHES = {
+    'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache', 'LOCATION': 'test-default'},
+    'versions': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache', 'LOCATION': 'test-versions'},
+    'pages': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache', 'LOCATION': 'test-pages'},
+}
+
+
+def _course_sheet(rows):
+    return _xlsx(COURSE_HEADERS, [
+        [kn, kn, en, year, semester, 'English', title, 'A', 'Mon', '09:00-12:00', 1, 'Online', apply_, reason, 1234]
+        for kn, en, year, semester, title, apply_, reason in rows
+    ])
+
+
+@override_settings(CACHES=TEST_CACHES)
+class BenchScenarioTests(TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.ds = Dataset(ROWS)
+        cls.tmpdir = tempfile.mkdtemp(prefix='dlc-test-')
+        cls.settings_override = override_settings(EXPORT_SNAPSHOT_DIR=cls.tmpdir, MEDIA_ROOT=cls.tmpdir)
+        cls.settings_override.enable()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.settings_override.disable()
+        shutil.rmtree(cls.tmpdir, ignore_errors=True)
+        super().tearDownClass()
+
+    def run_scenario(self, name):
+        """시나리오 하나를 실행하고 (run 의 반환값, 쿼리 수) 반환."""
+        setup, run = SCENARIOS[name]
+        client = Client()
+        _reset()
+        setup(client, self.ds)
+        queries = _QueryStats()
+        with connection.execute_wrapper(queries):
+            result = run(client, self.ds)
+        return result, queries.count
+
+    def test_query_ceilings(self):
+        results = run_benchmarks([ROWS], memory=False, log=lambda r: None)
+        self.assertEqual({r['scenario'] for r in results}, set(SCENARIOS))
+        for r in results:
+            with self.subTest(r['scenario']):
+                self.assertGreater(r['queries'], 0)
+                self.assertLessEqual(r['queries'], QUERY_CEILINGS[r['scenario']])
+
+    def test_faculty_upload(self):
+        response, _ = self.run_scenario('faculty_upload')
+        self.assertIn(f'신규 {ROWS}건', response.context['message'])
+        self.assertEqual(Faculty.objects.count(), ROWS)
+
+        response, queries = self.run_scenario('faculty_upload_repeat')
+        self.assertIn('같은 파일입니다', response.context['message'])
+        self.assertEqual(queries, 1)
+
+    def test_course_upload_edited(self):
+        response, _ = self.run_scenario('course_upload_edited')
+        self.assertIn(f'신규 0건, 변경 {EDITS}건, 변경 없음 {ROWS - EDITS}건', response.context['message'])
+        self.assertEqual(CourseModality.objects.filter(course_title__endswith='(edited)').count(), EDITS)
+
+    def test_course_upload_force(self):
+        response, _ = self.run_scenario('course_upload_force')
+        self.assertIn(f'신규 0건, 변경 0건, 변경 없음 {ROWS}건', response.context['message'])
+
+    def test_export_header(self):
+        content, _ = self.run_scenario('course_admin_export_csv')
+        rows = list(csv.reader(io.StringIO(content.decode('utf-8-sig'))))
+        self.assertEqual(rows[0], EXPORT_HEADERS)
+        self.assertEqual(len(rows), export_queryset().count() + 1)  # 기본: 현재 학기
+
+    def test_export_snapshot_matches(self):
+        first, _ = self.run_scenario('course_admin_export_snapshot')
+        self.assertEqual(first, _export(Client(), 'xlsx'))
+
+    def test_bulk_apply(self):
+        self.run_scenario('course_admin_bulk_apply')
+        self.assertFalse(CourseModality.objects.filter(term_semester=3, apply_this_semester=True).exists())
+
+    def test_new_term_adds_records(self):
+        client = Client()
+
+        def upload(rows):
+            return client.post('/course/upload/', {'file': _upload('course.xlsx', _course_sheet(rows)), 'admin_pin': ADMIN_PIN})
+
+        upload([('김민수', 'Kim Minsu', 2025, 'Fall', 'Fall course', 'Yes', 'fall reason')])
+        upload([('김민수', 'Kim Minsu', 2026, 'Spring', 'Spring course', None, '')])
+        fall, spring = CourseModality.objects.filter(korean_name='김민수').order_by('id')
+        self.assertEqual((fall.course_title, fall.apply_this_semester, fall.reason_for_applying),
+                         ('Fall course', True, 'fall reason'))
+        self.assertEqual((spring.apply_this_semester, spring.reason_for_applying), (False, ''))
+
+        result = archive_courses()
+        self.assertEqual((result['before'], result['archived']), ('2026 Spring', 1))
+        self.assertEqual(CourseModalityArchive.objects.get().original_id, fall.id)
+        self.assertEqual(list(CourseModality.objects.values_list('id', flat=True)), [spring.id])
+
+    def test_compare_flags_regressions(self):
+        baseline = [{'scenario': 'course_upload', 'rows': ROWS, 'seconds': 1.0, 'queries': 10, 'peak_mb': 5.0}]
+        result = [{'scenario': 'course_upload', 'rows': ROWS, 'seconds': 1.0, 'queries': 20, 'peak_mb': 5.0}]
+        lines, regressed = compare(result, baseline, 0.2)
+        self.assertTrue(regressed)
+        self.assertFalse(compare(baseline, baseline, 0.2)[1])
+
+
+class StartupTests(TestCase):
+
+    def test_form_worker_skips_heavy_modules(self):
+        results = {r['scenario']: r for r in measure_startup(repeat=1, log=lambda r: None)}
+        self.assertEqual(results['startup']['heavy_modules'], [])
+        self.assertIn('pandas', results['startup_full']['heavy_modules'])
+        self.assertLess(results['startup']['peak_mb'], results['startup_full']['peak_mb'])
@@ -0,0 +1,74 @@
+"""
+엑셀/CSV 업로드 처리 (화면 요청과 백그라운드 작업(jobs) 공통).
+- 파일은 iter_frames 로 청크 단위로 읽고, 청크마다 바로 병합(청크별 트랜잭션)
+- progress(rows_processed, total_rows) 콜백으로 진행 상황을 알린다. (total_rows 는 끝날 때까지 None)
+- 증분 업로드(incremental): 마지막과 같은 파일은 거부, 바뀌지 않은 행은 병합 생략 (force=True 이면 전체 처리)
+"""
+from .incremental import RowFilter, file_sha256, forget_file, is_duplicate_file, remember_file
+from .ingest import build_course_plan, describe_plan, extract_course_frame, iter_frames, normalize_faculty_frame
+from .merge import empty_summary, merge_courses, merge_faculty_frame
+from .metrics import registry
+
+
+def _no_progress(rows_processed, total_rows):
+    pass
+
+
+def _add(total, summary):
+    for key, value in summary.items():
+        total[key] += value
+
+
+def _process(kind, f, progress, force, prepare, merge):
+    """
+    공통 처리 흐름. prepare(chunk) -> (정규화된 frame, skipped), merge(frame, skipped) -> summary.
+    반환: {'summary', 'duplicate'}
+    """
+    sha256 = file_sha256(f)
+    if not force and is_duplicate_file(kind, sha256):
+        return {'summary': empty_summary(), 'duplicate': True}
+
+    # 청크마다 따로 commit 되므로 중간에 실패해도 이전 파일의 hash 가 남지 않도록 먼저 지우고, 끝나면 새 hash 저장
+    forget_file(kind)
+    rows_filter = RowFilter(kind, force)
+    summary, rows = empty_summary(), 0
+    for chunk in iter_frames(f):
+        frame, skipped = prepare(chunk)
+        frame, unchanged, digests = rows_filter.split(frame)
+        result = merge(frame, skipped)
+        result['unchanged'] += unchanged
+        _add(summary, result)
+        rows_filter.remember(digests)
+        rows += len(chunk)
+        progress(rows, None)
+    remember_file(kind, sha256, rows)
+    registry.inc('dlc_rows_ingested_total', rows, kind=kind)
+    progress(rows, rows)
+    return {'summary': summary, 'duplicate': False}
+
+
+def process_faculty_upload(f, progress=_no_progress, force=False):
+    """Faculty 엑셀을 병합하고 {'summary': ..., 'duplicate': ...} 반환."""
+    return _process('faculty', f, progress, force, normalize_faculty_frame, merge_faculty_frame)
+
+
+def process_course_upload(f, progress=_no_progress, force=False):
+    """Course Modality 엑셀을 병합하고 {'summary': ..., 'duplicate': ..., 'plan_rows': ...} 반환."""
+    plans = []
+
+    def prepare(chunk):
+        plans.append(build_course_plan(chunk.columns))
+        return extract_course_frame(chunk, plans[-1]), 0
+
+    def merge(frame, skipped):
+        return merge_courses(frame)
+
+    result = _process('course', f, progress, force, prepare, merge)
+    result['plan_rows'] = describe_plan(plans[-1]) if plans else []
+    return result
+
+
+PROCESSORS = {
+    'faculty': process_faculty_upload,
+    'course': process_course_upload,
+}
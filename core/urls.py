@@ -1,5 +1,5 @@
 from django.urls import path
-from . import views
+from . import api, views
 
 app_name = 'core'
 
@@ -8,9 +8,18 @@ urlpatterns = [
     path('faculty/upload/', views.faculty_upload, name='faculty_upload'),
     path('faculty/enrich/', views.faculty_enrich_upload, name='faculty_enrich'),
     path('faculty/search/', views.faculty_search, name='faculty_search'),
+    path('resolve/', views.batch_resolve, name='batch_resolve'),
     path('course/upload/', views.course_upload, name='course_upload'),
+    path('upload/multi/', views.multi_upload, name='multi_upload'),
     path('course/search/', views.course_search, name='course_search'),
+    path('course/batch_lookup/', views.course_batch_lookup, name='course_batch_lookup'),
     path('course/apply/<int:pk>/', views.course_apply, name='course_apply'),
     path('course/lookup/<int:pk>/', views.course_lookup, name='course_lookup'),
     path('course/admin_export/', views.course_admin_export, name='course_admin_export'),
+    path('course/admin_export/download/', views.course_admin_export_download, name='course_admin_export_download'),
+    path('jobs/<int:pk>/status/', views.upload_job_status, name='upload_job_status'),
+    path('metrics', views.metrics, name='metrics'),
+    path('api/faculty/search', api.faculty_search_api, name='faculty_search_api'),
+    path('api/course/search', api.course_search_api, name='course_search_api'),
+    path('api/course/lookup', api.course_lookup_api, name='course_lookup_api'),
 ]
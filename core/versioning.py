@@ -0,0 +1,39 @@
+"""
+데이터 버전(data version) 관리.
+- Faculty / CourseModality 가 바뀔 때(업로드, course_apply, admin 수정 등) 해당 모델의 버전을 새 값으로 바꾼다.
+- 검색 인덱스 등 메모리 캐시는 버전이 바뀌었을 때만 다시 만든다.
+- 여러 worker 프로세스가 같은 값을 보도록 'versions' 캐시(파일 기반)에 저장.
+"""
+import uuid
+
+from django.core.cache import caches
+
+VERSION_CACHE = 'versions'
+
+
+def _key(model):
+    return f'dlc:data_version:{model._meta.label_lower}'
+
+
+def bump_data_version(*models):
+    """models 의 버전을 새 값으로 교체."""
+    store = caches[VERSION_CACHE]
+    store.set_many({_key(m): uuid.uuid4().hex[:12] for m in models}, timeout=None)
+
+
+def get_data_version(*models):
+    """
+    models 의 현재 버전 문자열. (models 생략 시 Faculty, CourseModality, CourseModalityArchive 전체)
+    아직 버전이 없으면 새로 만든다.
+    """
+    if not models:
+        from .models import CourseModality, CourseModalityArchive, Faculty
+        models = (Faculty, CourseModality, CourseModalityArchive)
+    store = caches[VERSION_CACHE]
+    keys = [_key(m) for m in models]
+    found = store.get_many(keys)
+    for key in keys:
+        if key not in found:
+            store.add(key, uuid.uuid4().hex[:12], timeout=None)
+            found[key] = store.get(key)
+    return '-'.join(found[k] for k in keys)
@@ -1,114 +1,59 @@
 import io
+import itertools
+import os
+import time
+from urllib.parse import urlencode
+from django.conf import settings
 from django.shortcuts import render, redirect, get_object_or_404
-from django.http import HttpResponse
+from django.template.loader import render_to_string
+from django.urls import reverse
+from django.utils.cache import patch_cache_control
+from django.utils.http import http_date
+from django.views.decorators.http import condition, require_GET
+from django.contrib.admin.views.decorators import staff_member_required
+from django.db.models import Q
+from django.http import Http404, HttpResponse, JsonResponse
 from django.utils import timezone
-import pandas as pd
-from .models import Faculty, CourseModality
-from .forms import UploadFileForm, SimpleSearchForm, ApplyPasswordForm
-from rapidfuzz import fuzz, process
+from .models import Faculty, CourseModality, UploadJob
+from .forms import UploadFileForm, SimpleSearchForm, CourseSearchForm, ApplyPasswordForm, BatchResolveForm, BatchLookupForm, MultiUploadForm
+from .db import retry_on_lock
+from .export import SNAPSHOT_FORMATS, XLSX_CONTENT_TYPE, snapshot_etag, snapshot_last_modified, snapshot_response, write_xlsx
+from .jobs import enqueue, job_status
+from .metrics import registry
+from .normalize import norm_cell, search_key
+from .pagecache import get_or_build, public_record
+from .terms import SCOPE_CHOICES, SCOPES, active_term_label, scoped_courses
+# pandas / rapidfuzz / numpy 를 쓰는 모듈(uploads, ingest, enrich, batch_ingest, resolve, lookup, search_index)은
+# 해당 view 안에서 import -> 신청/조회 폼만 처리하는 worker 는 로드하지 않는다
 
 ADMIN_PIN = '1205'  # 예제용 하드코드
 
+_JOB_MESSAGE = '백그라운드 작업으로 등록되었습니다. 아래에서 진행 상황을 확인하세요.'
+# PIN 확인 후 등록한 업로드 작업 id (upload_job_status 는 이 세션에 있는 작업만 보여준다)
+_JOB_SESSION_KEY = 'dlc_upload_jobs'
+_JOB_SESSION_LIMIT = 20
+_DUPLICATE_MESSAGE = '마지막으로 업로드한 파일과 같은 파일입니다. 변경 사항이 없어 처리하지 않았습니다. (다시 처리하려면 "Reprocess all rows" 선택)'
+
 # -----------------------------
 # Helper functions: place these AFTER imports/ADMIN_PIN and BEFORE any view functions
 # -----------------------------
-def _norm_cell(value):
-    """
-    엑셀 셀 값(normalize).
-    - NaN -> ''
-    - 숫자(예: 1205.0) -> '1205' (정수이면 소수점 제거)
-    - 문자열 -> strip() 된 문자열 반환
-    """
-    if pd.isna(value):
-        return ''
-    if isinstance(value, (int,)):
-        return str(value)
-    if isinstance(value, float):
-        if value.is_integer():
-            return str(int(value))
-        else:
-            return str(value)
-    return str(value).strip()
+def _summary_message(prefix, summary):
+    """병합 요약(dict)을 화면 메시지로 변환."""
+    return (f"{prefix} (신규 {summary['inserted']}건, 변경 {summary['updated']}건, "
+            f"변경 없음 {summary['unchanged']}건, 건너뜀 {summary['skipped']}건)")
 
-def _get_password_from_row(row):
-    """
-    여러 후보 칼럼명에서 password 값을 찾아 normalize 하여 반환.
-    """
-    candidates = ['password', 'Password', 'PASSWORD', 'pin', 'PIN', 'pass', 'Pass', 'PIN_code', 'password_code']
-    for c in candidates:
-        if c in row:
-            val = _norm_cell(row.get(c))
-            if val != '':
-                return val
-    for key in row.keys():
-        if key and key.strip().lower() in ('password', 'pin', 'pass'):
-            val = _norm_cell(row.get(key))
-            if val != '':
-                return val
-    return ''
-
-def _get_reason_from_row(row):
-    candidates = ['Reason for Applying', 'Reason', 'reason_for_applying', 'reason', 'Reason_for_Applying']
-    for c in candidates:
-        if c in row:
-            val = _norm_cell(row.get(c))
-            if val != '':
-                return val
-    for key in row.keys():
-        if key and key.strip().lower() in ('reason for applying', 'reason', 'reason_for_applying'):
-            val = _norm_cell(row.get(key))
-            if val != '':
-                return val
-    return ''
-
-def _parse_bool_cell(value):
-    """Convert cell value to boolean if possible. Returns None if unknown/empty."""
-    v = _norm_cell(value)
-    if v == '':
-        return None
-    vl = v.strip().lower()
-    if vl in ('yes', 'y', 'true', '1', 'apply'):
-        return True
-    if vl in ('no', 'n', 'false', '0'):
-        return False
-    return None
 
-# -----------------------------
-# 추가/수정할 helper 및 함수 (core/views.py에 아래 블록들 삽입/교체)
-# -----------------------------
+def _upload_message(prefix, result):
+    if result['duplicate']:
+        return _DUPLICATE_MESSAGE
+    return _summary_message(prefix, result['summary'])
 
-def _get_field(row, candidates):
-    """
-    row: dict-like (pandas Series.to_dict())
-    candidates: list of possible column header names (case-sensitive first pass)
-    반환: normalized string (''이면 없음)
-    """
-    # 1) 정확한 후보명 우선 탐색
-    for c in candidates:
-        if c in row:
-            val = _norm_cell(row.get(c))
-            if val != '':
-                return val
-    # 2) 키들의 소문자 형태로 비교 (공백/언더스코어 차이 보정)
-    lowmap = { (k.strip().lower() if k else ''): k for k in row.keys() }
-    for c in candidates:
-        key = c.strip().lower()
-        if key in lowmap and lowmap[key] is not None:
-            val = _norm_cell(row.get(lowmap[key]))
-            if val != '':
-                return val
-    # 3) 보다 유연한 매칭: 후보 단어가 키에 포함되는지 확인
-    for key in row.keys():
-        if not key:
-            continue
-        kk = key.strip().lower()
-        for c in candidates:
-            if c.strip().lower() in kk or kk in c.strip().lower():
-                val = _norm_cell(row.get(key))
-                if val != '':
-                    return val
-    return ''
 
+def _enqueue_upload(request, kind, f, force):
+    """업로드 작업을 등록하고 작업 id 를 세션에 기록 (최근 _JOB_SESSION_LIMIT 개)."""
+    job = enqueue(kind, f, force=force)
+    request.session[_JOB_SESSION_KEY] = [*request.session.get(_JOB_SESSION_KEY, []), job.id][-_JOB_SESSION_LIMIT:]
+    return job
 
 
 # -----------------------------
@@ -120,6 +65,7 @@ def index(request):
 
 def faculty_upload(request):
     message = ''
+    job = None
     if request.method == 'POST':
         form = UploadFileForm(request.POST, request.FILES)
         if form.is_valid():
@@ -128,46 +74,32 @@ def faculty_upload(request):
                 message = '관리자 PIN이 잘못되었습니다.'
             else:
                 f = request.FILES['file']
-                df = pd.read_excel(f)
-                for _, row in df.iterrows():
-                    kn = str(row.get('Korean_name', '')).strip()
-                    if not kn:
-                        continue
-                    en = str(row.get('English_name', '') or '').strip()
-                    cat = str(row.get('Category', '') or '').strip()
-                    email = str(row.get('Email', '') or '').strip()
-                    Faculty.objects.update_or_create(
-                        korean_name=kn,
-                        defaults={'english_name': en, 'category': cat, 'email': email}
-                    )
-                message = '업로드 및 병합이 완료되었습니다.'
+                force = form.cleaned_data['force']
+                if form.cleaned_data['background']:
+                    job = _enqueue_upload(request, 'faculty', f, force)
+                    message = _JOB_MESSAGE
+                else:
+                    from .uploads import process_faculty_upload
+                    result = process_faculty_upload(f, force=force)
+                    message = _upload_message('업로드 및 병합이 완료되었습니다.', result)
     else:
         form = UploadFileForm()
-    return render(request, 'core/faculty_upload.html', {'form': form, 'message': message})
+    return render(request, 'core/faculty_upload.html', {'form': form, 'message': message, 'job': job})
 
 def faculty_enrich_upload(request):
     message = ''
     if request.method == 'POST' and request.FILES.get('file'):
+        from .enrich import enrich_faculty
+        from .ingest import iter_frames
         f = request.FILES['file']
-        df = pd.read_excel(f)
-        if 'Korean_name' not in df.columns:
+        frames = iter_frames(f)
+        first = next(frames)
+        if 'Korean_name' not in first.columns:
             message = '엑셀에 "Korean_name" 컬럼이 필요합니다.'
         else:
-            out_rows = []
-            for _, row in df.iterrows():
-                kn = str(row.get('Korean_name', '')).strip()
-                if not kn:
-                    out_rows.append({'No': '', 'Korean_name': '', 'English_name': '', 'Category': '', 'Email': ''})
-                    continue
-                try:
-                    fac = Faculty.objects.get(korean_name=kn)
-                    out_rows.append({'No': '', 'Korean_name': kn, 'English_name': fac.english_name, 'Category': fac.category, 'Email': fac.email})
-                except Faculty.DoesNotExist:
-                    out_rows.append({'No': '', 'Korean_name': kn, 'English_name': '', 'Category': '', 'Email': ''})
-            out_df = pd.DataFrame(out_rows)
-            out_df.index = range(1, len(out_df) + 1)
-            out_df.reset_index(inplace=True)
-            out_df.rename(columns={'index': 'No'}, inplace=True)
+            out_df = enrich_faculty(itertools.chain([first], frames), fuzzy_fill=bool(request.POST.get('fuzzy_fill')))
+            registry.inc('dlc_rows_ingested_total', len(out_df), kind='faculty_enrich')
+            registry.inc('dlc_rows_exported_total', len(out_df), kind='faculty_enrich')
             buffer = io.BytesIO()
             out_df.to_excel(buffer, index=False)
             buffer.seek(0)
@@ -176,28 +108,76 @@ def faculty_enrich_upload(request):
             return response
     return render(request, 'core/faculty_enrich.html', {'message': message})
 
-def faculty_search(request):
-    results = []
-    form = SimpleSearchForm(request.GET or None)
+def _uploaded_names(f):
+    """업로드 파일의 Korean_name 컬럼(없으면 첫 번째 컬럼) 값 목록."""
+    from .ingest import iter_frames
+    names = []
+    for df in iter_frames(f):
+        if not len(df.columns):
+            break
+        col = df['Korean_name'] if 'Korean_name' in df.columns else df.iloc[:, 0]
+        names.extend(v for v in map(norm_cell, col) if v)
+    return names
+
+
+def batch_resolve(request):
+    """이름 목록을 Faculty / Course 이름과 일괄 fuzzy 매칭해서 엑셀 또는 JSON 으로 반환."""
+    form = BatchResolveForm(request.POST or None, request.FILES or None)
+    if request.method == 'POST' and form.is_valid():
+        from .resolve import resolve_names, resolve_rows
+        data = form.cleaned_data
+        names = [n.strip() for n in data['names'].splitlines() if n.strip()]
+        if data['file']:
+            names += _uploaded_names(data['file'])
+        scope = data['scope'] or 'current'
+        results = resolve_names(names, data['target'], data['limit'], data['score_cutoff'], scope=scope)
+        registry.inc('dlc_rows_ingested_total', len(names), kind='batch_resolve')
+        if data['output'] == 'json':
+            return JsonResponse({'target': data['target'], 'limit': data['limit'], 'results': results},
+                                json_dumps_params={'ensure_ascii': False})
+        headers, rows = resolve_rows(results, data['target'], scope)
+        buffer = io.BytesIO()
+        write_xlsx(rows, buffer, headers=headers)
+        buffer.seek(0)
+        response = HttpResponse(buffer, content_type=XLSX_CONTENT_TYPE)
+        response['Content-Disposition'] = f"attachment; filename={data['target']}_resolved.xlsx"
+        return response
+    return render(request, 'core/batch_resolve.html', {'form': form})
+
+
+def _faculty_results(name):
+    key = search_key(name)
+    results = list(Faculty.objects.filter(Q(korean_key=key) | Q(english_key=key)).order_by('id')) if key else []
+    if not results:
+        from .search_index import get_name_index
+        match = get_name_index(Faculty).lookup(name)
+        if match:
+            results = list(Faculty.objects.filter(id__in=match[2]))
+    return results
+
+
+def _search_page(request, namespace, template, results_template, find, form_class=SimpleSearchForm, context=None):
+    """검색 화면 공통: 결과 목록 HTML 은 (데이터 버전, 검색어, 검색 옵션) 별로 캐시. 검색어 외의 폼 값은 find 의 keyword 인자."""
+    form = form_class(request.GET or None)
+    results_html = ''
     if form.is_valid():
-        name = form.cleaned_data['name'].strip()
-        qs = Faculty.objects.filter(korean_name__iexact=name) | Faculty.objects.filter(english_name__iexact=name)
-        if qs.exists():
-            results = list(qs)
-        else:
-            all_names = list(Faculty.objects.values_list('korean_name', flat=True))
-            if all_names:
-                match = process.extractOne(name, all_names, scorer=fuzz.ratio)
-                if match and match[1] >= 70:
-                    try:
-                        results = [Faculty.objects.get(korean_name=match[0])]
-                    except Faculty.DoesNotExist:
-                        results = []
-    return render(request, 'core/faculty_search.html', {'form': form, 'results': results})
-
-# --- course_upload에서 frequency_week, password, reason 등 파싱에 _get_field 사용 ---
+        name = ' '.join(form.cleaned_data['name'].split())
+        options = {k: v for k, v in form.cleaned_data.items() if k != 'name'}
+        results_html = get_or_build(namespace, (name, *options.values()),
+                                    lambda: render_to_string(results_template, {'results': find(name, **options)}))
+    else:
+        results_html = render_to_string(results_template, {'results': []})
+    return render(request, template, {'form': form, 'results_html': results_html, **(context or {})})
+
+
+def faculty_search(request):
+    return _search_page(request, 'faculty_search', 'core/faculty_search.html', 'core/_faculty_results.html', _faculty_results)
+
+# --- course_upload: 헤더 매핑(column plan)은 파일당 한 번만 계산 ---
 def course_upload(request):
     message = ''
+    plan_rows = []
+    job = None
     if request.method == 'POST':
         form = UploadFileForm(request.POST, request.FILES)
         if form.is_valid():
@@ -206,106 +186,100 @@ def course_upload(request):
                 message = '관리자 PIN이 잘못되었습니다.'
             else:
                 f = request.FILES['file']
-                df = pd.read_excel(f, dtype=object)
-                for _, raw_row in df.iterrows():
-                    row = raw_row.to_dict()
-                    # Korean_name 찾기
-                    kn = _get_field(row, ['Korean_name', 'Korean name', 'korean_name', 'name_kr', 'Name(KR)', 'Name'])
-                    if not kn:
-                        continue
-
-                    defaults = {
-                        'name': _get_field(row, ['Name', 'name', 'Instructor', 'Instructor Name']),
-                        'english_name': _get_field(row, ['English_name', 'English name', 'english_name']),
-                        'year': _get_field(row, ['Year', 'year']),
-                        'semester': _get_field(row, ['Semester', 'semester']),
-                        'language': _get_field(row, ['Language', 'language']),
-                        'course_title': _get_field(row, ['Course Title', 'Course_Title', 'course_title', 'Title']),
-                        'time_slot': _get_field(row, ['Time Slot', 'Time_Slot', 'time_slot']),
-                        'day': _get_field(row, ['Day', 'day']),
-                        'time': _get_field(row, ['Time', 'time']),
-                        # frequency_week을 다양한 후보명에서 찾아 넣음
-                        'frequency_week': _get_field(row, ['Frequency(Week)', 'Frequency', 'Frequency (Week)', 'Frequency Week', 'frequency_week']),
-                        'course_format': _get_field(row, ['Course format', 'Course_format', 'course_format']),
-                    }
-
-                    # password, reason, apply 처리
-                    pw = _get_password_from_row(row)
-                    if pw != '':
-                        defaults['password'] = pw
-
-                    reason = _get_reason_from_row(row)
-                    apply_flag = None
-                    apply_flag = _get_field(row, ['Apply this semester(Online 70)', 'Apply this semester', 'Apply', 'Apply_this_semester'])
-                    if apply_flag != '':
-                        apply_flag = _parse_bool_cell(apply_flag)
-                    else:
-                        apply_flag = None
-
-                    # get_or_create / merge logic (기존 로직 유지)
-                    obj, created = CourseModality.objects.get_or_create(korean_name=kn, defaults=defaults)
-                    if not created:
-                        changed = False
-                        for fld, val in defaults.items():
-                            if val != '' and getattr(obj, fld, '') != val:
-                                setattr(obj, fld, val)
-                                changed = True
-                        if reason != '':
-                            obj.reason_for_applying = reason
-                            obj.modified_date = timezone.now()
-                            changed = True
-                        if apply_flag is not None:
-                            obj.apply_this_semester = bool(apply_flag)
-                            obj.modified_date = timezone.now()
-                            changed = True
-                        if 'password' in defaults and defaults.get('password', '') != '':
-                            if (obj.password or '').strip() != defaults['password'].strip():
-                                obj.password = defaults['password']
-                                changed = True
-                        if changed:
-                            obj.save()
-                    else:
-                        if reason != '' or apply_flag is not None:
-                            if reason != '':
-                                obj.reason_for_applying = reason
-                            if apply_flag is not None:
-                                obj.apply_this_semester = bool(apply_flag)
-                            obj.modified_date = timezone.now()
-                            obj.save()
-                message = 'Course Modality 업로드 및 병합 완료.'
+                force = form.cleaned_data['force']
+                if form.cleaned_data['background']:
+                    job = _enqueue_upload(request, 'course', f, force)
+                    message = _JOB_MESSAGE
+                else:
+                    from .uploads import process_course_upload
+                    result = process_course_upload(f, force=force)
+                    plan_rows = result['plan_rows']
+                    message = _upload_message('Course Modality 업로드 및 병합 완료.', result)
     else:
         form = UploadFileForm()
-    return render(request, 'core/course_upload.html', {'form': form, 'message': message})
+    return render(request, 'core/course_upload.html', {'form': form, 'message': message, 'plan_rows': plan_rows, 'job': job})
+
+
+def multi_upload(request):
+    """여러 파일 / zip / 여러 시트를 한 번에 업로드 (병렬 파싱 + 소스별 결과)."""
+    message = ''
+    report = None
+    if request.method == 'POST':
+        form = MultiUploadForm(request.POST, request.FILES)
+        if form.is_valid():
+            if form.cleaned_data['admin_pin'] != ADMIN_PIN:
+                message = '관리자 PIN이 잘못되었습니다.'
+            else:
+                from .batch_ingest import ingest_files
+                report = ingest_files(form.cleaned_data['kind'], form.cleaned_data['files'], force=form.cleaned_data['force'])
+                message = _summary_message(f"{len(report['sources'])}개 소스 병합 완료.", report['summary'])
+    else:
+        form = MultiUploadForm()
+    return render(request, 'core/multi_upload.html', {'form': form, 'message': message, 'report': report})
+
+
+def upload_job_status(request, pk):
+    """
+    백그라운드 업로드 작업 진행 상황(JSON). 업로드 화면에서 주기적으로 조회.
+    작업 id 는 순번이므로 PIN 을 확인하고 작업을 등록한 세션(_enqueue_upload)에서만 조회 가능, 그 외는 404.
+    """
+    if pk not in request.session.get(_JOB_SESSION_KEY, []):
+        raise Http404
+    job = get_object_or_404(UploadJob, pk=pk)
+    return JsonResponse(job_status(job))
+
+
+@staff_member_required
+def metrics(request):
+    """성능 지표(Prometheus text format). Django admin(staff) 로그인 필요."""
+    return HttpResponse(registry.render(), content_type='text/plain; version=0.0.4; charset=utf-8')
 
 
 # 붙여넣을 함수들: course_search, course_apply, course_lookup, course_admin_export
 # (core/views.py의 끝에 추가하세요)
 
+def _course_results(name, scope=''):
+    """scope(기본: 현재 학기) 범위의 레코드에서 검색. 'archive' 이면 CourseModalityArchive 레코드."""
+    scope = scope or 'current'
+    courses = scoped_courses(scope)
+    key = search_key(name)
+    results = list(courses.filter(Q(korean_key=key) | Q(english_key=key)).order_by('id')) if key else []
+    if not results:
+        from .search_index import get_name_index
+        match = get_name_index(CourseModality, scope).lookup(name)
+        if match:
+            results = list(courses.filter(id__in=match[2]).order_by('id'))
+    return results
+
+
 def course_search(request):
-    form = SimpleSearchForm(request.GET or None)
+    return _search_page(request, 'course_search', 'core/course_search.html', 'core/_course_results.html', _course_results,
+                        form_class=CourseSearchForm, context={'active_term': active_term_label()})
+
+
+def course_batch_lookup(request):
+    """여러 교원 이름의 Course Modality 레코드를 한 번에 조회 (이름별로 묶어서 표시)."""
+    form = BatchLookupForm(request.POST or None)
     results = []
-    if form.is_valid():
-        name = form.cleaned_data['name'].strip()
-        qs = CourseModality.objects.filter(korean_name__iexact=name) | CourseModality.objects.filter(english_name__iexact=name)
-        if qs.exists():
-            results = list(qs)
-        else:
-            candidates = list(CourseModality.objects.values_list('korean_name', flat=True)) + list(CourseModality.objects.values_list('english_name', flat=True))
-            if candidates:
-                match = process.extractOne(name, candidates, scorer=fuzz.ratio)
-                if match and match[1] >= 70:
-                    results = list(CourseModality.objects.filter(korean_name=match[0]) | CourseModality.objects.filter(english_name=match[0]))
-    return render(request, 'core/course_search.html', {'form': form, 'results': results})
+    message = ''
+    if request.method == 'POST' and form.is_valid():
+        from .lookup import MAX_NAMES, lookup_courses
+        names = [n for n in form.cleaned_data['names'].splitlines() if n.strip()]
+        if len(names) > MAX_NAMES:
+            message = f'한 번에 최대 {MAX_NAMES}명까지 조회할 수 있습니다. 앞의 {MAX_NAMES}명만 조회했습니다.'
+            names = names[:MAX_NAMES]
+        results = lookup_courses(names, scope=form.cleaned_data['scope'] or 'current')
+    return render(request, 'core/course_batch_lookup.html', {'form': form, 'results': results, 'message': message})
 
 
 def course_apply(request, pk):
-    record = get_object_or_404(CourseModality, pk=pk)
     message = ''
     if request.method == 'POST':
+        record = get_object_or_404(CourseModality, pk=pk)
         form = ApplyPasswordForm(request.POST)
         if form.is_valid():
-            pw = form.cleaned_data['record_password'].strip()
-            stored_pw = (record.password or '').strip()
+            pw = norm_cell(form.cleaned_data['record_password'])
+            stored_pw = norm_cell(record.password)
             if pw != stored_pw:
                 message = '비밀번호가 틀립니다.'
             else:
@@ -317,37 +291,53 @@ def course_apply(request, pk):
                         record.reason_for_applying = new_reason
                         record.apply_this_semester = True
                         record.modified_date = timezone.now()
-                        record.save()
+                        retry_on_lock(lambda: record.save(update_fields=['reason_for_applying', 'apply_this_semester', 'modified_date']))
                         message = 'Your application has been saved.'
                 if 'cancel' in request.POST:
                     record.apply_this_semester = False
                     record.modified_date = timezone.now()
-                    record.save()
+                    retry_on_lock(lambda: record.save(update_fields=['apply_this_semester', 'modified_date']))
                     message = 'Your application has been cancelled.'
                 return render(request, 'core/course_apply.html', {'record': record, 'form': form, 'message': message, 'unlocked': True})
     else:
+        # GET: 비밀번호 입력 화면은 공개 정보만 필요 -> 캐시된 dict 사용
+        record = public_record(pk)
         form = ApplyPasswordForm()
     return render(request, 'core/course_apply.html', {'record': record, 'form': form, 'message': message, 'unlocked': False})
 
 
 def course_lookup(request, pk):
-    record = get_object_or_404(CourseModality, pk=pk)
     message = ''
     shown = False
     if request.method == 'POST':
+        record = get_object_or_404(CourseModality, pk=pk)
         form = ApplyPasswordForm(request.POST)
         if form.is_valid():
-            pw = form.cleaned_data['record_password'].strip()
-            stored_pw = (record.password or '').strip()
+            pw = norm_cell(form.cleaned_data['record_password'])
+            stored_pw = norm_cell(record.password)
             if pw != stored_pw:
                 message = '비밀번호가 틀립니다.'
             else:
                 shown = True
     else:
+        record = public_record(pk)
         form = ApplyPasswordForm()
     return render(request, 'core/course_lookup.html', {'record': record, 'form': form, 'message': message, 'shown': shown})
 
-# --- course_admin_export: 'Name' 컬럼 제거 (export에서 보이지 않게) ---
+# --- course_admin_export: 'Name' 컬럼 제거 (export에서 보이지 않게), 컬럼 목록은 core/export.py ---
+# PIN 확인(POST) 후 세션에 표시 -> GET 다운로드 URL 에서 데이터 버전별 스냅샷 파일을 전송 (ETag / Last-Modified)
+_EXPORT_SESSION_KEY = 'dlc_export_unlocked_at'
+
+
+def _export_params(request):
+    """(format, year, semester, scope) — year / semester 가 없으면 scope(기본: 현재 학기) 범위 전체."""
+    fmt = request.GET.get('format', 'xlsx')
+    scope = request.GET.get('scope', 'current')
+    return (fmt if fmt in SNAPSHOT_FORMATS else 'xlsx',
+            request.GET.get('year', '').strip(), request.GET.get('semester', '').strip(),
+            scope if scope in SCOPES else 'current')
+
+
 def course_admin_export(request):
     message = ''
     if request.method == 'POST':
@@ -355,35 +345,30 @@ def course_admin_export(request):
         if pin != ADMIN_PIN:
             message = '관리자 PIN이 잘못되었습니다.'
         else:
-            qs = CourseModality.objects.all().order_by('id')
-            rows = []
-            for rec in qs:
-                rows.append({
-                    'No': rec.id,
-                    # 'Name' 컬럼 삭제 요청에 따라 제거함
-                    'Korean_name': rec.korean_name,
-                    'English_name': rec.english_name,
-                    'Year': rec.year,
-                    'Semester': rec.semester,
-                    'Language': rec.language,
-                    'Course Title': rec.course_title,
-                    'Time Slot': rec.time_slot,
-                    'Day': rec.day,
-                    'Time': rec.time,
-                    'Frequency(Week)': rec.frequency_week,   # rec.frequency_week에 저장된 값이 출력됨
-                    'Course format': rec.course_format,
-                    'Apply this semester(Online 70)': 'Yes' if rec.apply_this_semester else 'No',
-                    'Reason for Applying': rec.reason_for_applying,
-                    'Modified Date': rec.modified_date.isoformat() if rec.modified_date else '',
-                    'password': rec.password,
-                })
-            df = pd.DataFrame(rows)
-            buffer = io.BytesIO()
-            df.to_excel(buffer, index=False)
-            buffer.seek(0)
-            response = HttpResponse(buffer, content_type='application/vnd.openxmlformats-officedocument.spreadsheetml.sheet')
-            response['Content-Disposition'] = 'attachment; filename=course_modality_export.xlsx'
-            return response
-    return render(request, 'core/course_admin_export.html', {'message': message})
+            request.session[_EXPORT_SESSION_KEY] = time.time()
+            params = {'format': request.POST.get('format', 'xlsx'),
+                      'year': request.POST.get('year', '').strip(),
+                      'semester': request.POST.get('semester', '').strip(),
+                      'scope': request.POST.get('scope', '')}
+            return redirect(reverse('core:course_admin_export_download') + '?' + urlencode({k: v for k, v in params.items() if v}))
+    return render(request, 'core/course_admin_export.html',
+                  {'message': message, 'scopes': SCOPE_CHOICES, 'active_term': active_term_label()})
+
+
+@condition(etag_func=lambda request: snapshot_etag(*_export_params(request)),
+           last_modified_func=lambda request: snapshot_last_modified(*_export_params(request)))
+def _export_download(request):
+    response = snapshot_response(*_export_params(request))
+    if not response.has_header('Last-Modified'):  # 이번 요청에서 스냅샷을 새로 만든 경우
+        response['Last-Modified'] = http_date(os.fstat(response.file_to_stream.fileno()).st_mtime)
+    return response
 
 
+@require_GET
+def course_admin_export_download(request):
+    unlocked_at = request.session.get(_EXPORT_SESSION_KEY)
+    if not unlocked_at or time.time() - unlocked_at > settings.EXPORT_SESSION_SECONDS:
+        return redirect('core:course_admin_export')
+    response = _export_download(request)
+    patch_cache_control(response, private=True, no_cache=True)
+    return response
@@ -19,6 +19,7 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    'core.middleware.PerformanceMiddleware',
     'django.middleware.security.SecurityMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
@@ -45,12 +46,37 @@ TEMPLATES = [
 
 WSGI_APPLICATION = 'dlc_operation.wsgi.application'
 
+# SQLite 동시 접속: WAL / synchronous pragma 는 core/db.py 에서 연결할 때 설정
 DATABASES = {
     'default': {
         'ENGINE': 'django.db.backends.sqlite3',
         'NAME': BASE_DIR / 'db.sqlite3',
+        'OPTIONS': {'timeout': 20},  # 쓰기 lock 대기 시간(초, busy timeout)
+        'CONN_MAX_AGE': 600,  # 요청마다 다시 연결하지 않도록 유지
+        'CONN_HEALTH_CHECKS': True,
     }
 }
+SQLITE_SYNCHRONOUS = 'NORMAL'
+
+# 'versions': 데이터 버전(검색 인덱스 무효화용). worker 프로세스끼리 공유해야 하므로 파일 기반.
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+    },
+    'versions': {
+        'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache',
+        'LOCATION': BASE_DIR / 'cache' / 'versions',
+        'TIMEOUT': None,
+    },
+    # 검색 결과 / 공개 레코드 정보 (core/pagecache.py). 키에 데이터 버전이 들어가므로 TTL 은 메모리 회수용
+    # 여러 worker 프로세스가 공유하려면 FileBasedCache (LOCATION: BASE_DIR / 'cache' / 'pages') 로 바꿔도 됨
+    'pages': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': 'dlc-pages',
+        'TIMEOUT': 600,
+        'OPTIONS': {'MAX_ENTRIES': 5000},
+    },
+}
 
 LANGUAGE_CODE = 'en-us'
 TIME_ZONE = 'UTC'
@@ -60,3 +86,22 @@ USE_TZ = True
 STATIC_URL = '/static/'
 STATIC_ROOT = BASE_DIR / 'staticfiles'
 STATICFILES_DIRS = [BASE_DIR / 'static']
+
+# 백그라운드 업로드 작업(UploadJob) 파일 저장 위치
+MEDIA_ROOT = BASE_DIR / 'media'
+# 이 시간(초)보다 오래 'running' 인 업로드 작업은 중단된 것으로 보고 실패 처리
+UPLOAD_JOB_TIMEOUT = 3600
+
+# 이 시간(ms)보다 오래 걸린 요청은 core.perf 로거에 warning 으로 기록
+PERF_SLOW_REQUEST_MS = 2000
+
+# 관리자 export 스냅샷 파일 (데이터 버전 + 필터별, core/export.py)
+EXPORT_SNAPSHOT_DIR = BASE_DIR / 'cache' / 'exports'
+# 관리자 PIN 입력 후 다운로드 URL 을 쓸 수 있는 시간(초)
+EXPORT_SESSION_SECONDS = 3600
+
+# 여러 파일 업로드(core/batch_ingest.py) 파싱 프로세스 수 (None: CPU 코어 수)
+INGEST_WORKERS = None
+
+# 검색 / export / fuzzy 이름 인덱스의 기본 학기 (예: '2025 Fall', '2026-1'). None: DB 에 있는 가장 최근 학기
+ACTIVE_TERM = None